@@ -0,0 +1,70 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import importlib
+from typing import ClassVar
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Typer group whose sub-apps are imported the first time they are invoked.
+
+    Subclasses list them in ``lazy_subcommands`` as
+    ``{name: (module path, short help)}``; the module must expose a Typer
+    ``app``. Help and completion render from the short help alone, so
+    ``--help`` never imports a command module or its drivers.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, tuple[str, str]]] = {}
+    _describing: bool = False
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        return commands + [n for n in self.lazy_subcommands if n not in commands]
+
+    def get_command(
+        self, ctx: typer.Context, cmd_name: str
+    ) -> typer.core.TyperCommand | TyperGroup | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_subcommands:
+            return command
+
+        module_path, short_help = self.lazy_subcommands[cmd_name]
+        if self._describing:
+            return TyperGroup(name=cmd_name, help=short_help)
+
+        command = typer.main.get_group(importlib.import_module(module_path).app)
+        command.name = cmd_name
+        if not command.help:
+            command.help = short_help
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: typer.Context, formatter) -> None:
+        self._describing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._describing = False
+
+    def shell_complete(self, ctx: typer.Context, incomplete: str) -> list:
+        self._describing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._describing = False
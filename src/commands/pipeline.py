@@ -0,0 +1,195 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import logging
+import signal
+import threading
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Annotated, Any
+
+import typer
+
+from src.configs import get_config, project_meta
+from src.connections.utils.pg_catalog import TableMetadata
+
+if TYPE_CHECKING:
+    from src.connections.ckafka import KafkaRecord
+
+logger = logging.getLogger(project_meta.name)
+app = typer.Typer(pretty_exceptions_show_locals=False)
+
+
+class LoadMode(str, Enum):
+    copy = "copy"
+    upsert = "upsert"
+
+
+def _to_rows(
+    records: list["KafkaRecord"],
+    metadata: TableMetadata,
+    skip_invalid: bool = False,
+    keep_order: bool = False,
+) -> list[tuple[list[str], list[dict[str, Any]]]]:
+    """
+    Decode JSON records into groups of rows shaped for ``metadata``.
+
+    Fields that are not table columns are dropped. Rows are grouped by which
+    columns with a DEFAULT they carry, so a group's load never writes an
+    explicit NULL over a default; other columns some rows of a group lack are
+    loaded as NULL. Records that aren't JSON objects or miss a required column
+    raise ``ValidationError``, or are logged and skipped with ``skip_invalid``.
+
+    :param keep_order: Only group consecutive rows, so loading the groups one
+        after another applies the rows in record order (needed for upserts).
+    :return: ``(columns, rows)`` per group, columns in table order.
+    """
+    from src.connections.postgre import ValidationError
+
+    column_types = metadata.column_types
+    required = metadata.required_columns
+    defaults = {c.name for c in metadata.columns if c.has_default}
+    groups: list[tuple[frozenset[str], set[str], list[dict[str, Any]]]] = []
+    index: dict[frozenset[str], int] = {}
+    for record in records:
+        try:
+            value = json.loads(record.value) if record.value is not None else None
+            if not isinstance(value, dict):
+                raise ValidationError("value is not a JSON object")
+            row = {k: v for k, v in value.items() if k in column_types}
+            missing = [c for c in required if row.get(c) is None]
+            if missing:
+                raise ValidationError(f"missing required columns: {', '.join(missing)}")
+        except (ValueError, ValidationError) as e:
+            message = f"Invalid record {record.topic}[{record.partition}]@{record.offset}: {e}"
+            if not skip_invalid:
+                raise ValidationError(message) from e
+            logger.warning(message)
+            continue
+        key = frozenset(defaults.intersection(row))
+        if keep_order:
+            if not groups or groups[-1][0] != key:
+                groups.append((key, set(), []))
+            _, present, rows = groups[-1]
+        else:
+            if key not in index:
+                index[key] = len(groups)
+                groups.append((key, set(), []))
+            _, present, rows = groups[index[key]]
+        present.update(row)
+        rows.append(row)
+
+    result = []
+    for _, present, rows in groups:
+        columns = [c for c in column_types if c in present]
+        result.append((columns, [{c: row.get(c) for c in columns} for row in rows]))
+    return result
+
+
+@app.command("kafka-to-pg")
+def kafka_to_pg(
+    schema: Annotated[str, typer.Option(help="Target schema.")],
+    table: Annotated[str, typer.Option(help="Target table.")],
+    topic: Annotated[
+        list[str] | None,
+        typer.Option(help="Topic to consume, defaults to KAFKA__TOPICS."),
+    ] = None,
+    mode: Annotated[
+        LoadMode, typer.Option(help="Plain COPY or upsert.")
+    ] = LoadMode.copy,
+    conflict_column: Annotated[
+        list[str] | None,
+        typer.Option(help="Upsert conflict target, defaults to the primary key."),
+    ] = None,
+    batch_size: Annotated[
+        int, typer.Option(help="Maximum records per micro-batch.")
+    ] = 5_000,
+    batch_timeout: Annotated[
+        float, typer.Option(help="Seconds to wait for a micro-batch to fill.")
+    ] = 1.0,
+    workers: Annotated[int, typer.Option(help="Parallel partition loaders.")] = 4,
+    skip_invalid: Annotated[
+        bool, typer.Option(help="Log and skip invalid records instead of stopping.")
+    ] = False,
+) -> None:
+    """
+    Stream JSON records from Kafka into a PostgreSQL table.
+
+    Records are micro-batched per partition by size or time, validated against
+    the table metadata and bulk-loaded, one transaction per group of rows
+    carrying the same defaulted columns. Kafka offsets are committed only
+    after all of a batch's groups have committed, so a crash replays at most
+    the uncommitted batches (in copy mode, a batch that failed partway may
+    leave its earlier groups loaded twice).
+    """
+    from src.connections.ckafka import KafkaConnector
+    from src.connections.postgre import PostgreConnector
+
+    config = get_config()
+    if config.kafka is None or config.postgres is None:
+        raise typer.BadParameter("KAFKA__* and POSTGRES__* settings are required.")
+    kafka_meta = config.kafka
+    if topic:
+        kafka_meta = kafka_meta.model_copy(update={"topics": topic})
+
+    pg = PostgreConnector(config.postgres)
+    pg.open_pool(min_size=1, max_size=workers)
+    kafka = KafkaConnector(kafka_meta)
+    kafka.initialize_consumer(enable_auto_commit=False)
+
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+
+    def _load(records: list["KafkaRecord"]) -> None:
+        groups = _to_rows(
+            records,
+            pg.get_table_metadata(schema, table),
+            skip_invalid,
+            keep_order=mode is LoadMode.upsert,
+        )
+        for columns, rows in groups:
+            if mode is LoadMode.upsert:
+                pg.upsert_rows(
+                    schema,
+                    table,
+                    rows,
+                    columns=columns,
+                    conflict_columns=conflict_column,
+                    batch_size=len(rows),
+                )
+            else:
+                pg.copy_rows(schema, table, rows, columns=columns, batch_size=len(rows))
+
+    started = time.monotonic()
+    try:
+        handled = kafka.consume_batches(
+            _load,
+            num_messages=batch_size,
+            timeout=batch_timeout,
+            max_workers=workers,
+            max_pending=batch_size * workers * 4,
+            stop_event=stop_event,
+        )
+    finally:
+        kafka.close()
+        pg.close()
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Loaded {handled} records into {schema}.{table} "
+        f"({handled / elapsed if elapsed else 0:.0f} records/s)."
+    )
@@ -14,31 +14,79 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from typica.utils.log import CustomLogLevel, setup_logger
-
-from .env import ApplicationConfig, ProjectConfig
-
-config = ApplicationConfig()
-project_meta = ProjectConfig()
-
-
-setup_logger(
-    **{
-        "name": project_meta.name,
-        "base_level": CustomLogLevel.DEBUG,
-        "console": True,
-        "console_level": CustomLogLevel.INFO,
-        "log_dir": "./logs",
-        "file_handlers_config": [
-            {
-                "filename": "prod_debug.log",
-                "level": CustomLogLevel.DEBUG,
-                "max_bytes": 5_000_000,
-                "backup_count": 5,
-            }
-        ],
-    }
-)
-
-__all__ = [logging, CustomLogLevel, config, ProjectConfig]
+if TYPE_CHECKING:
+    from .env import ApplicationConfig, ProjectConfig
+
+
+@lru_cache(maxsize=1)
+def get_config() -> "ApplicationConfig":
+    from .env import ApplicationConfig
+
+    return ApplicationConfig()
+
+
+@lru_cache(maxsize=1)
+def get_project_meta() -> "ProjectConfig":
+    from .env import ProjectConfig
+
+    return ProjectConfig()
+
+
+@lru_cache(maxsize=1)
+def setup_logging() -> None:
+    """
+    Configure the project logger once, creating ``./logs`` and its rotating
+    file handler. Called by the CLI before any command runs.
+    """
+    from typica.utils.log import CustomLogLevel, setup_logger
+
+    setup_logger(
+        **{
+            "name": get_project_meta().name,
+            "base_level": CustomLogLevel.DEBUG,
+            "console": True,
+            "console_level": CustomLogLevel.INFO,
+            "log_dir": "./logs",
+            "file_handlers_config": [
+                {
+                    "filename": "prod_debug.log",
+                    "level": CustomLogLevel.DEBUG,
+                    "max_bytes": 5_000_000,
+                    "backup_count": 5,
+                }
+            ],
+        }
+    )
+
+
+def __getattr__(name: str):
+    # ``config``, ``project_meta`` and ``CustomLogLevel`` are resolved on first
+    # access so importing this package stays cheap.
+    if name == "config":
+        return get_config()
+    if name == "project_meta":
+        return get_project_meta()
+    if name == "CustomLogLevel":
+        from typica.utils.log import CustomLogLevel
+
+        return CustomLogLevel
+    if name == "ProjectConfig":
+        from .env import ProjectConfig
+
+        return ProjectConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "logging",
+    "CustomLogLevel",
+    "config",
+    "project_meta",
+    "ProjectConfig",
+    "get_config",
+    "get_project_meta",
+    "setup_logging",
+]
@@ -13,15 +13,49 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from pydantic import BaseModel
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     PyprojectTomlConfigSettingsSource,
     SettingsConfigDict,
 )
+from typica.connection import DBConnectionMeta, KafkaMeta
+
+
+class PGAlchemyConfig(BaseModel):
+    """SQLAlchemy engine tuning, e.g. ``PG_ALCHEMY__POOL_SIZE=20``."""
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    pool_use_lifo: bool = False
+    # psycopg prepares a query server-side after this many runs, None disables
+    prepare_threshold: int | None = 5
+    insertmanyvalues_page_size: int = 1000
+
+
+class MongoConfig(BaseModel):
+    """Shared MongoClient pool settings, e.g. ``MONGO__MAX_POOL_SIZE=200``."""
+
+    max_pool_size: int = 100
+    min_pool_size: int = 0
+    max_idle_time_ms: int | None = None
+    # Wire compression in order of preference: zstd, snappy, zlib
+    compressors: list[str] = []
+    read_preference: str = "primary"
+    server_selection_timeout_ms: int = 30_000
 
 
 class ApplicationConfig(BaseSettings):
+    pg_alchemy: PGAlchemyConfig = PGAlchemyConfig()
+    mongo: MongoConfig = MongoConfig()
+    # Connection settings, e.g. ``KAFKA__BOOTSTRAP_SERVERS`` / ``POSTGRES__HOST``
+    kafka: KafkaMeta | None = None
+    postgres: DBConnectionMeta | None = None
+
     model_config = SettingsConfigDict(
         env_nested_delimiter="__",
         env_file=".env",
@@ -14,8 +14,29 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any
 
-from confluent_kafka import Consumer, Producer
+from confluent_kafka import (
+    Consumer,
+    KafkaError,
+    KafkaException,
+    Message,
+    Producer,
+    TopicPartition,
+)
 from typica.connection import KafkaMeta
 
 from src.configs import CustomLogLevel, project_meta
@@ -23,28 +44,421 @@ from src.configs import CustomLogLevel, project_meta
 LOGGER = logging.getLogger(project_meta.name)
 
 
+@dataclass
+class ProducerStats:
+    """
+    Delivery counters of a producer.
+
+    Delivery reports are served by the background poll thread and by
+    ``flush`` on the caller's thread, so updates go through a lock.
+    """
+
+    produced: int = 0
+    delivered: int = 0
+    failed: int = 0
+    delivered_bytes: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    last_error: KafkaError | None = None
+    started: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_produced(self, count: int = 1) -> None:
+        with self._lock:
+            self.produced += count
+
+    def record_delivery(self, err: KafkaError | None, msg: Message) -> None:
+        with self._lock:
+            if err is not None:
+                self.failed += 1
+                self.last_error = err
+            else:
+                latency = msg.latency() or 0.0
+                self.delivered += 1
+                self.delivered_bytes += len(msg)
+                self.latency_total += latency
+                self.latency_max = max(self.latency_max, latency)
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self.produced - self.delivered - self.failed
+
+    @property
+    def msgs_per_sec(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.delivered / elapsed if elapsed else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.latency_total / self.delivered * 1000 if self.delivered else 0.0
+
+
+@dataclass(frozen=True)
+class KafkaRecord:
+    """Picklable copy of a consumed message, safe to hand to a process pool."""
+
+    topic: str
+    partition: int
+    offset: int
+    key: bytes | None
+    value: bytes | None
+    timestamp: int | None = None
+    headers: list[tuple[str, bytes]] | None = None
+
+    @classmethod
+    def from_message(cls, msg: Message) -> "KafkaRecord":
+        _, timestamp = msg.timestamp()
+        return cls(
+            topic=msg.topic(),
+            partition=msg.partition(),
+            offset=msg.offset(),
+            key=msg.key(),
+            value=msg.value(),
+            timestamp=timestamp,
+            headers=msg.headers(),
+        )
+
+
+class _PartitionDispatcher:
+    """
+    Run record groups on an executor, one at a time per partition.
+
+    A partition's next group is only submitted once the previous one has
+    finished, so handlers see each partition in order and a finished group's
+    offset can be committed without gaps.
+    """
+
+    def __init__(self, executor: Executor, handler: Callable[[list[KafkaRecord]], Any]):
+        self._executor = executor
+        self._handler = handler
+        self._running: dict[tuple[str, int], tuple[Future, int, int]] = {}
+        self._queued: dict[tuple[str, int], deque[list[KafkaRecord]]] = defaultdict(
+            deque
+        )
+        self.pending = 0
+        self.handled = 0
+        self.error: BaseException | None = None
+
+    def dispatch(self, records: list[KafkaRecord]) -> None:
+        groups: dict[tuple[str, int], list[KafkaRecord]] = defaultdict(list)
+        for record in records:
+            groups[(record.topic, record.partition)].append(record)
+        for tp, group in groups.items():
+            self._queued[tp].append(group)
+            self.pending += len(group)
+            self._start_next(tp)
+
+    def _start_next(self, tp: tuple[str, int]) -> None:
+        if tp in self._running or not self._queued[tp]:
+            return
+        group = self._queued[tp].popleft()
+        future = self._executor.submit(self._handler, group)
+        self._running[tp] = (future, group[-1].offset + 1, len(group))
+
+    def collect(self, timeout: float = 0) -> list[TopicPartition]:
+        """
+        Reap finished groups and start the next group of their partitions.
+
+        A failed group drops the partition's queued groups, so nothing past it
+        is committed, and its exception is kept in :attr:`error` (the first one
+        wins). Other partitions are still reaped, so commit the returned
+        offsets before acting on the error.
+
+        :return: Offsets that are now safe to commit.
+        """
+        if timeout and self._running:
+            futures = [future for future, _, _ in self._running.values()]
+            wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        offsets = []
+        for tp, (future, offset, size) in list(self._running.items()):
+            if not future.done():
+                continue
+            del self._running[tp]
+            self.pending -= size
+            if future.exception() is not None:
+                self.pending -= sum(len(group) for group in self._queued[tp])
+                self._queued[tp].clear()
+                self.error = self.error or future.exception()
+                LOGGER.error(
+                    f"Kafka handler failed for {tp[0]}[{tp[1]}]: {future.exception()}"
+                )
+                continue
+            self.handled += size
+            offsets.append(TopicPartition(tp[0], tp[1], offset))
+            self._start_next(tp)
+        return offsets
+
+    def drain(
+        self, partitions: list[TopicPartition] | None = None
+    ) -> list[TopicPartition]:
+        """
+        Block until the given partitions (all when ``None``) have no work left.
+
+        :return: Offsets reaped meanwhile, for any partition.
+        """
+        keys = (
+            None
+            if partitions is None
+            else {(tp.topic, tp.partition) for tp in partitions}
+        )
+        offsets: dict[tuple[str, int], TopicPartition] = {}
+        while any(keys is None or tp in keys for tp in self._running):
+            for tp in self.collect(timeout=1.0):
+                offsets[(tp.topic, tp.partition)] = tp
+        return list(offsets.values())
+
+
 class KafkaConnector:
     consumer: Consumer
     producer: Producer
 
     def __init__(self, meta: KafkaMeta) -> None:
         self._meta: KafkaMeta = meta
+        self._poll_thread: threading.Thread | None = None
+        self._poll_stop = threading.Event()
+        self._in_flight: threading.BoundedSemaphore | None = None
+        self.producer_stats = ProducerStats()
+
+    def initialize_producer(
+        self,
+        linger_ms: int = 20,
+        batch_size: int = 1_000_000,
+        compression: str = "lz4",
+        acks: str = "all",
+        max_in_flight: int = 100_000,
+        poll_interval: float = 0.1,
+        **config: Any,
+    ) -> None:
+        """
+        Create the producer and start a background thread serving delivery reports.
+
+        Only messages sent through :meth:`produce` count against
+        ``max_in_flight`` and ``producer_stats``; calling ``producer.produce``
+        directly bypasses both.
 
-    def initialize_producer(self) -> None:
+        :param linger_ms: ``linger.ms``, how long librdkafka waits to fill a batch.
+        :param batch_size: ``batch.size``, maximum bytes per partition batch.
+        :param compression: ``compression.type`` (none, gzip, snappy, lz4, zstd).
+        :param acks: ``acks`` required from the brokers.
+        :param max_in_flight: Undelivered messages allowed before ``produce`` blocks.
+        :param poll_interval: Seconds each background ``poll`` waits for events.
+        :param config: Extra librdkafka settings, dots written as underscores.
+        """
         try:
-            self.producer = Producer(self._meta.basic_confluent_config_json)
+            self.producer = Producer(
+                {
+                    **self._meta.basic_confluent_config_json,
+                    "linger.ms": linger_ms,
+                    "batch.size": batch_size,
+                    "compression.type": compression,
+                    "acks": acks,
+                    "queue.buffering.max.messages": max_in_flight,
+                    **{k.replace("_", "."): v for k, v in config.items()},
+                }
+            )
             LOGGER.log(CustomLogLevel.CONNECTION, "Kafka connected.")
         except Exception as e:
             raise e
 
-    def initialize_consumer(self) -> None:
+        self.producer_stats = ProducerStats()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop,
+            args=(poll_interval,),
+            name="kafka-producer-poll",
+            daemon=True,
+        )
+        self._poll_thread.start()
+
+    def _poll_loop(self, interval: float) -> None:
+        while not self._poll_stop.is_set():
+            try:
+                self.producer.poll(interval)
+            except Exception:
+                LOGGER.exception("Kafka producer poll failed.")
+
+    def _on_delivery(self, err: KafkaError | None, msg: Message) -> None:
         try:
-            self.consumer = Consumer(self._meta.consumer_confluent_config_json)
+            self.producer_stats.record_delivery(err, msg)
+            if err is not None:
+                LOGGER.error(f"Kafka delivery failed for {msg.topic()}: {err}")
+        finally:
+            self._in_flight.release()
+
+    def produce(
+        self,
+        topic: str,
+        value: str | bytes | None,
+        key: str | bytes | None = None,
+        headers: dict | list | None = None,
+        partition: int | None = None,
+    ) -> None:
+        """
+        Queue one message without flushing.
+
+        Blocks while ``max_in_flight`` messages are undelivered. If the local
+        queue is still full (e.g. by bytes), waits for the poll thread to
+        serve deliveries instead of raising ``BufferError``.
+        """
+        self._in_flight.acquire()
+        kwargs: dict[str, Any] = {
+            "key": key,
+            "headers": headers,
+            "on_delivery": self._on_delivery,
+        }
+        if partition is not None:
+            kwargs["partition"] = partition
+        # Counted before queueing so a fast delivery can't outrun it.
+        self.producer_stats.record_produced()
+        while True:
+            try:
+                self.producer.produce(topic, value, **kwargs)
+                break
+            except BufferError:
+                time.sleep(0.05)
+            except Exception:
+                self.producer_stats.record_produced(-1)
+                self._in_flight.release()
+                raise
+
+    def produce_batch(
+        self,
+        topic: str,
+        records: Iterable[tuple[str | bytes | None, str | bytes | None]],
+    ) -> int:
+        """
+        Queue ``(key, value)`` records; delivery continues in the background.
+
+        :return: Number of records queued.
+        """
+        count = 0
+        for key, value in records:
+            self.produce(topic, value, key=key)
+            count += 1
+        return count
+
+    def flush(self, timeout: float = 30.0) -> int:
+        """
+        Wait for outstanding deliveries.
+
+        :return: Messages still undelivered when the timeout expired.
+        """
+        remaining = self.producer.flush(timeout)
+        if remaining:
+            LOGGER.warning(f"Kafka flush timed out with {remaining} messages pending.")
+        return remaining
+
+    def initialize_consumer(self, **config: Any) -> None:
+        """
+        :param config: Extra librdkafka settings, dots written as underscores.
+        """
+        try:
+            self.consumer = Consumer(
+                {
+                    **self._meta.consumer_confluent_config_json,
+                    **{k.replace("_", "."): v for k, v in config.items()},
+                }
+            )
             LOGGER.log(CustomLogLevel.CONNECTION, "Kafka connected.")
         except Exception as e:
             raise e
 
+    def consume_batches(
+        self,
+        handler: Callable[[list[KafkaRecord]], Any],
+        num_messages: int = 500,
+        timeout: float = 1.0,
+        max_workers: int = 4,
+        use_processes: bool = False,
+        max_pending: int = 20_000,
+        stop_event: threading.Event | None = None,
+    ) -> int:
+        """
+        Consume the meta topics in batches and process them on a worker pool.
+
+        Each ``consume`` batch is split per partition and handed to ``handler``;
+        a partition's groups run one after another, different partitions run in
+        parallel. Offsets are committed asynchronously once every earlier group
+        of the partition has finished, and synchronously for partitions being
+        revoked. If a handler raises, the loop stops and the exception is
+        re-raised after in-flight work is drained; the failed group is not
+        committed and will be redelivered.
+
+        The consumer is created with ``enable.auto.commit`` off unless
+        :meth:`initialize_consumer` was already called.
+
+        :param handler: Called with the records of one partition; must be
+            picklable when ``use_processes`` is set.
+        :param num_messages: Maximum messages per ``consume`` call.
+        :param timeout: Seconds each ``consume`` call waits for messages.
+        :param max_workers: Size of the worker pool.
+        :param use_processes: Use a process pool instead of threads, for CPU-bound handlers.
+        :param max_pending: Unprocessed records allowed before the assignment is paused.
+        :param stop_event: Set it to stop the loop gracefully.
+        :return: Number of records handled successfully.
+        """
+        if not hasattr(self, "consumer") or self.consumer is None:
+            self.initialize_consumer(enable_auto_commit=False)
+        stop_event = stop_event or threading.Event()
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+
+        with pool_cls(max_workers=max_workers) as executor:
+            dispatcher = _PartitionDispatcher(executor, handler)
+
+            def _on_revoke(
+                consumer: Consumer, partitions: list[TopicPartition]
+            ) -> None:
+                offsets = dispatcher.drain(partitions)
+                if offsets:
+                    consumer.commit(offsets=offsets, asynchronous=False)
+
+            self.consumer.subscribe(self._meta.topic_list, on_revoke=_on_revoke)
+            paused = False
+            try:
+                while not stop_event.is_set():
+                    records = []
+                    for msg in self.consumer.consume(num_messages, timeout):
+                        if msg.error():
+                            if msg.error().code() == KafkaError._PARTITION_EOF:
+                                continue
+                            raise KafkaException(msg.error())
+                        records.append(KafkaRecord.from_message(msg))
+                    if records:
+                        dispatcher.dispatch(records)
+
+                    offsets = dispatcher.collect()
+                    if offsets:
+                        self.consumer.commit(offsets=offsets, asynchronous=True)
+                    if dispatcher.error is not None:
+                        raise dispatcher.error
+
+                    if (dispatcher.pending >= max_pending) != paused:
+                        paused = not paused
+                        assignment = self.consumer.assignment()
+                        if paused:
+                            self.consumer.pause(assignment)
+                        else:
+                            self.consumer.resume(assignment)
+            finally:
+                offsets = dispatcher.drain()
+                if offsets:
+                    self.consumer.commit(offsets=offsets, asynchronous=False)
+                if paused:
+                    self.consumer.resume(self.consumer.assignment())
+
+        return dispatcher.handled
+
     def close(self) -> None:
         if hasattr(self, "consumer") and self.consumer:
             self.consumer.close()
+        if self._poll_thread is not None:
+            self.flush()
+            self._poll_stop.set()
+            self._poll_thread.join()
+            self._poll_thread = None
         LOGGER.log(CustomLogLevel.CONNECTION, "Kafka disconnected.")
@@ -13,36 +13,85 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import base64
 import logging
+import threading
+import time
 import types
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
 from typing import Any
 
 from elasticsearch7 import Elasticsearch as Es7, helpers as helper_es7
 from elasticsearch8 import Elasticsearch as Es8, helpers as helper_es8
-from requests import get as requests_get
-from requests.auth import HTTPBasicAuth
+from requests import Session
+from requests.adapters import HTTPAdapter
 from typica.connection import ESConnectionMeta
 
 from src.configs import project_meta
+from src.connections.utils.batching import iter_batches, iter_parallel
+from src.connections.utils.exporters import EXPORT_FORMATS, write_documents
 
 LOGGER = logging.getLogger(project_meta.name)
 
+# Shared keep-alive session for version discovery, and versions seen per endpoint
+_SESSION: Session | None = None
+_SESSION_LOCK = threading.Lock()
+_VERSION_CACHE: dict[str, str] = {}
+
+
+def _get_session() -> Session:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            _SESSION.mount("http://", adapter)
+            _SESSION.mount("https://", adapter)
+        return _SESSION
+
+
+def _cloud_endpoint(cloud_id: str) -> str:
+    """Decode the Elasticsearch URL from an Elastic Cloud id."""
+    _, _, encoded = cloud_id.partition(":")
+    host, es_uuid, *_ = base64.b64decode(encoded).decode("utf-8").split("$")
+    host, _, port = host.partition(":")
+    return f"https://{es_uuid}.{host}:{port or 443}"
+
+
+@dataclass
+class BulkBatchStats:
+    batch: int
+    docs: int
+    succeeded: int
+    elapsed: float
+    failed: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.docs / self.elapsed if self.elapsed else 0.0
+
+
+class BaseESConnector:
+    """Endpoint, credentials and version discovery shared by the sync and async connectors."""
 
-class ESConnector:
     _meta: ESConnectionMeta
-    _client: Es7 | Es8
-    _helpers: types.ModuleType
 
     @property
     def endpoint_uri(self):
         return f"http://{self._meta.host}:{self._meta.port}"
 
-    def __init__(self, meta: ESConnectionMeta):
+    def __init__(self, meta: ESConnectionMeta, version: str | None = None):
+        """
+        :param meta: The metadata of the Elasticsearch connection.
+        :param version: Server version, skips discovery when given.
+        """
         self._meta = meta
-
-    def __enter__(self) -> "ESConnector":
-        self.connect()
-        return self
+        self._version = version
 
     def _build_client_kwargs(self) -> dict[str, Any]:
         kwargs: dict[str, Any] = {}
@@ -63,22 +112,62 @@ class ESConnector:
 
         return kwargs
 
-    def get_version(self) -> str | None:
-        """Fetch the Elasticsearch server version."""
-        try:
-            auth = None
-            if self._meta.username and self._meta.password:
-                auth = HTTPBasicAuth(self._meta.username, self._meta.password)
+    @property
+    def discovery_uri(self) -> str:
+        if self._meta.cloud_id:
+            return _cloud_endpoint(self._meta.cloud_id)
+        return self.endpoint_uri
 
-            response = requests_get(self.endpoint_uri, auth=auth, timeout=10)
-            response.raise_for_status()
-            json_response = response.json()
+    def _build_request_kwargs(self) -> dict[str, Any]:
+        """Same credentials and TLS settings as ``_build_client_kwargs``, for requests."""
+        kwargs: dict[str, Any] = {"timeout": 10}
+        if self._meta.api_key:
+            kwargs["headers"] = {"Authorization": f"ApiKey {self._meta.api_key}"}
+        elif self._meta.username:
+            kwargs["auth"] = (self._meta.username, self._meta.password)
+
+        if self._meta.verify_ssl:
+            kwargs["verify"] = self._meta.ca_file or True
+            if self._meta.client_cert:
+                kwargs["cert"] = (self._meta.client_cert, self._meta.client_key)
 
-            return json_response.get("version", {}).get("number")
+        return kwargs
+
+    def get_version(self, refresh: bool = False) -> str | None:
+        """
+        Fetch the Elasticsearch server version.
+
+        The result is cached per endpoint for the lifetime of the process, and
+        the request reuses a shared keep-alive session.
+        """
+        if self._version and not refresh:
+            return self._version
+        endpoint = self.discovery_uri
+        if not refresh and endpoint in _VERSION_CACHE:
+            self._version = _VERSION_CACHE[endpoint]
+            return self._version
+        try:
+            response = _get_session().get(endpoint, **self._build_request_kwargs())
+            response.raise_for_status()
+            version = response.json().get("version", {}).get("number")
         except Exception as e:
             LOGGER.error("Failed to fetch Elasticsearch version.")
             raise e
 
+        if version:
+            _VERSION_CACHE[endpoint] = version
+        self._version = version
+        return version
+
+
+class ESConnector(BaseESConnector):
+    _client: Es7 | Es8
+    _helpers: types.ModuleType
+
+    def __enter__(self) -> "ESConnector":
+        self.connect()
+        return self
+
     def connect(self) -> None:
         if hasattr(self, "_client") and self._client:
             return self._client
@@ -100,24 +189,289 @@ class ESConnector:
         return self._client
 
     def _is_unhealthy(self, force: bool = True) -> bool:
-        """Check Elasticsearch health status."""
+        """Check Elasticsearch health status through the client's transport."""
         try:
-            auth = None
-            if self._meta.username and self._meta.password:
-                auth = HTTPBasicAuth(self._meta.username, self._meta.password)
-
-            response = requests_get(
-                f"{self.endpoint_uri}/_cluster/health",
-                auth=auth,
-                timeout=10,
-            )
-            response.raise_for_status()
-            status = response.json().get("status")
+            self.connect()
+            status = self._client.cluster.health().get("status")
         except Exception as e:
             LOGGER.warning(f"[Health Check Error] {e}")
             return True
         return status == "red" if force else status != "green"
 
+    def _bulk_chunk(
+        self, batch: int, chunk: list[dict[str, Any]], **bulk_kwargs: Any
+    ) -> BulkBatchStats:
+        started = time.perf_counter()
+        failed = [
+            item
+            for ok, item in self._helpers.streaming_bulk(
+                self._client,
+                chunk,
+                chunk_size=len(chunk),
+                raise_on_error=False,
+                raise_on_exception=False,
+                yield_ok=False,
+                **bulk_kwargs,
+            )
+            if not ok
+        ]
+        stats = BulkBatchStats(
+            batch=batch,
+            docs=len(chunk),
+            succeeded=len(chunk) - len(failed),
+            elapsed=time.perf_counter() - started,
+            failed=failed,
+        )
+        LOGGER.debug(
+            f"Bulk batch {batch}: {stats.succeeded}/{stats.docs} docs "
+            f"({stats.docs_per_sec:.0f} docs/s)."
+        )
+        return stats
+
+    def bulk_index(
+        self,
+        actions: Iterable[dict[str, Any]],
+        index: str | None = None,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 100 * 1024 * 1024,
+        thread_count: int = 4,
+        max_retries: int = 5,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 60.0,
+    ) -> Iterator[BulkBatchStats]:
+        """
+        Index a stream of documents with parallel ``_bulk`` requests.
+
+        Documents are cut into chunks of ``chunk_size`` which are sent by
+        ``thread_count`` workers through ``helpers.streaming_bulk``; a chunk
+        is split further when it exceeds ``max_chunk_bytes``. Requests and
+        items rejected with 429 are retried with exponential backoff. At most
+        ``2 * thread_count`` chunks are buffered, so the input is consumed
+        lazily.
+
+        :param actions: Documents or bulk actions (``_op_type``, ``_id``, ...).
+        :param index: Default ``_index`` for actions that don't carry one.
+        :return: Iterator of per-batch stats, in input order.
+        """
+        self.connect()
+        if index:
+            actions = ({"_index": index, **action} for action in actions)
+        bulk_kwargs = {
+            "max_chunk_bytes": max_chunk_bytes,
+            "max_retries": max_retries,
+            "initial_backoff": initial_backoff,
+            "max_backoff": max_backoff,
+        }
+
+        pending = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=thread_count, thread_name_prefix="es-bulk"
+        )
+        try:
+            for batch, chunk in enumerate(iter_batches(actions, chunk_size)):
+                pending.append(
+                    executor.submit(self._bulk_chunk, batch, chunk, **bulk_kwargs)
+                )
+                if len(pending) >= thread_count * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _iter_pit_slice(
+        self,
+        pit_id: str,
+        query: dict[str, Any],
+        slice_id: int,
+        slices: int,
+        page_size: int,
+        keep_alive: str,
+        source: list[str] | bool | None,
+    ) -> Iterator[dict[str, Any]]:
+        search_after = None
+        while True:
+            response = self._client.search(
+                pit={"id": pit_id, "keep_alive": keep_alive},
+                query=query,
+                sort=[{"_shard_doc": "asc"}],
+                size=page_size,
+                search_after=search_after,
+                slice={"id": slice_id, "max": slices} if slices > 1 else None,
+                source=source,
+                track_total_hits=False,
+            )
+            hits = response["hits"]["hits"]
+            if not hits:
+                return
+            pit_id = response.get("pit_id", pit_id)
+            search_after = hits[-1]["sort"]
+            yield from hits
+
+    def _iter_scroll_slice(
+        self,
+        index: str,
+        query: dict[str, Any],
+        slice_id: int,
+        slices: int,
+        page_size: int,
+        keep_alive: str,
+        source: list[str] | bool | None,
+    ) -> Iterator[dict[str, Any]]:
+        body: dict[str, Any] = {"query": query, "sort": ["_doc"]}
+        if slices > 1:
+            body["slice"] = {"id": slice_id, "max": slices}
+        if source is not None:
+            body["_source"] = source
+        response = self._client.search(
+            index=index, body=body, scroll=keep_alive, size=page_size
+        )
+        scroll_id = response.get("_scroll_id")
+        try:
+            while hits := response["hits"]["hits"]:
+                yield from hits
+                response = self._client.scroll(scroll_id=scroll_id, scroll=keep_alive)
+                scroll_id = response.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id:
+                self._client.clear_scroll(scroll_id=scroll_id)
+
+    def _slice_sources(
+        self,
+        index: str,
+        query: dict[str, Any] | None,
+        slices: int,
+        page_size: int,
+        keep_alive: str,
+        source: list[str] | bool | None,
+        pit_id: str | None,
+    ) -> list[Callable[[], Iterator[dict[str, Any]]]]:
+        query = query or {"match_all": {}}
+        if pit_id is not None:
+            return [
+                partial(
+                    self._iter_pit_slice,
+                    pit_id,
+                    query,
+                    i,
+                    slices,
+                    page_size,
+                    keep_alive,
+                    source,
+                )
+                for i in range(slices)
+            ]
+        return [
+            partial(
+                self._iter_scroll_slice,
+                index,
+                query,
+                i,
+                slices,
+                page_size,
+                keep_alive,
+                source,
+            )
+            for i in range(slices)
+        ]
+
+    def _open_pit(self, index: str, keep_alive: str) -> str | None:
+        """Open a point in time on ES8, ``None`` means fall back to scroll."""
+        if not isinstance(self._client, Es8):
+            return None
+        return self._client.open_point_in_time(index=index, keep_alive=keep_alive)["id"]
+
+    def _close_pit(self, pit_id: str | None) -> None:
+        if pit_id is None:
+            return
+        try:
+            self._client.close_point_in_time(id=pit_id)
+        except Exception:
+            LOGGER.warning("Failed to close point in time.", exc_info=True)
+
+    def scan_index(
+        self,
+        index: str,
+        query: dict[str, Any] | None = None,
+        slices: int = 1,
+        page_size: int = 1_000,
+        keep_alive: str = "5m",
+        source: list[str] | bool | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream every hit of ``index`` matching ``query``.
+
+        Uses point-in-time + ``search_after`` on ES8 and scroll on ES7. With
+        ``slices > 1`` the index is read by that many sliced searches in
+        parallel threads; hits are then yielded in arrival order.
+
+        :param query: Query DSL, defaults to ``match_all``.
+        :param slices: Number of parallel slices.
+        :param page_size: Hits per search request.
+        :param keep_alive: How long the PIT/scroll context survives between pages.
+        :param source: ``_source`` filter.
+        """
+        self.connect()
+        pit_id = self._open_pit(index, keep_alive)
+        try:
+            sources = self._slice_sources(
+                index, query, slices, page_size, keep_alive, source, pit_id
+            )
+            if len(sources) == 1:
+                yield from sources[0]()
+            else:
+                yield from iter_parallel(sources, buffer_size=page_size * slices)
+        finally:
+            self._close_pit(pit_id)
+
+    def export_index(
+        self,
+        index: str,
+        output_dir: str | Path,
+        fmt: str = "ndjson",
+        query: dict[str, Any] | None = None,
+        slices: int = 4,
+        page_size: int = 1_000,
+        keep_alive: str = "5m",
+        source: list[str] | bool | None = None,
+    ) -> dict[Path, int]:
+        """
+        Dump an index to one file per slice, slices are written in parallel.
+
+        Each line/row is the hit's ``_source`` plus its ``_id``, which
+        ``bulk_index`` can load back as-is.
+
+        :param fmt: ``"ndjson"`` or ``"parquet"``.
+        :return: Number of documents written per file.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"fmt must be one of {EXPORT_FORMATS}.")
+        self.connect()
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        pit_id = self._open_pit(index, keep_alive)
+        try:
+            sources = self._slice_sources(
+                index, query, slices, page_size, keep_alive, source, pit_id
+            )
+            paths = [output_dir / f"{index}-{i:04d}.{fmt}" for i in range(slices)]
+
+            def _write(path: Path, hits: Callable[[], Iterator[dict]]) -> int:
+                docs = ({"_id": h["_id"], **h.get("_source", {})} for h in hits())
+                return write_documents(path, docs, fmt)
+
+            with ThreadPoolExecutor(
+                max_workers=slices, thread_name_prefix="es-export"
+            ) as executor:
+                counts = list(executor.map(_write, paths, sources))
+        finally:
+            self._close_pit(pit_id)
+
+        LOGGER.info(f"Exported {sum(counts)} documents from {index}.")
+        return dict(zip(paths, counts, strict=True))
+
     def close(self):
         if hasattr(self, "_client") and self._client:
             try:
@@ -0,0 +1,153 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from elasticsearch7 import AsyncElasticsearch as AsyncEs7
+from elasticsearch8 import AsyncElasticsearch as AsyncEs8
+from typica.connection import ESConnectionMeta
+
+from src.configs import project_meta
+from src.connections.elastic import BaseESConnector
+from src.connections.utils.batching import iter_batches
+
+LOGGER = logging.getLogger(project_meta.name)
+
+
+class AsyncESConnector(BaseESConnector):
+    """
+    Asyncio counterpart of ``ESConnector`` built on ``AsyncElasticsearch``.
+
+    Use :meth:`search_many` / :meth:`msearch_many` to fan out many small
+    queries over one client; concurrency is bounded by a semaphore so the
+    connection pool is never oversubscribed.
+    """
+
+    _client: AsyncEs7 | AsyncEs8 | None = None
+
+    def __init__(
+        self,
+        meta: ESConnectionMeta,
+        version: str | None = None,
+        max_connections: int = 32,
+    ):
+        """
+        :param meta: The metadata of the Elasticsearch connection.
+        :param version: Server version, skips discovery when given.
+        :param max_connections: HTTP connections kept per node.
+        """
+        super().__init__(meta, version=version)
+        self._max_connections = max_connections
+
+    async def __aenter__(self) -> "AsyncESConnector":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def connect(self) -> AsyncEs7 | AsyncEs8:
+        if self._client is not None:
+            return self._client
+        try:
+            kwargs = self._build_client_kwargs()
+            version = await asyncio.to_thread(self.get_version)
+            if version and version.startswith("8"):
+                self._client = AsyncEs8(
+                    **kwargs, connections_per_node=self._max_connections
+                )
+            else:
+                self._client = AsyncEs7(**kwargs, maxsize=self._max_connections)
+
+            LOGGER.info("Elasticsearch async client initialized")
+        except Exception as e:
+            LOGGER.exception("Failed to create Elasticsearch async client")
+            raise e
+
+        return self._client
+
+    async def search(self, index: str, body: dict | None = None, **kwargs) -> dict:
+        client = await self.connect()
+        return await client.search(index=index, body=body, **kwargs)
+
+    async def search_many(
+        self,
+        searches: Iterable[tuple[str, dict]],
+        concurrency: int = 16,
+        return_exceptions: bool = False,
+    ) -> list[dict | BaseException]:
+        """
+        Run many ``search`` requests concurrently.
+
+        :param searches: ``(index, body)`` pairs.
+        :param concurrency: Maximum requests in flight at once.
+        :param return_exceptions: Return failures in place instead of raising the first one.
+        :return: Responses in the same order as ``searches``.
+        """
+        await self.connect()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(index: str, body: dict) -> dict:
+            async with semaphore:
+                return await self.search(index, body)
+
+        return await asyncio.gather(
+            *(_run(index, body) for index, body in searches),
+            return_exceptions=return_exceptions,
+        )
+
+    async def msearch_many(
+        self,
+        searches: Iterable[tuple[str, dict]],
+        batch_size: int = 100,
+        concurrency: int = 4,
+    ) -> list[dict]:
+        """
+        Group searches into ``msearch`` requests and send the batches concurrently.
+
+        Per-search failures come back as ``{"error": ...}`` entries, as with a
+        plain ``msearch``.
+
+        :param searches: ``(index, body)`` pairs.
+        :param batch_size: Searches per ``msearch`` request.
+        :param concurrency: Maximum ``msearch`` requests in flight at once.
+        :return: One response per search, in the same order as ``searches``.
+        """
+        client = await self.connect()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(batch: list[tuple[str, dict]]) -> list[dict]:
+            lines: list[dict] = []
+            for index, body in batch:
+                lines.extend(({"index": index}, body))
+            async with semaphore:
+                response = await client.msearch(body=lines)
+            return response["responses"]
+
+        batches = await asyncio.gather(
+            *(_run(batch) for batch in iter_batches(searches, batch_size))
+        )
+        return [item for batch in batches for item in batch]
+
+    async def close(self) -> None:
+        if self._client is not None:
+            try:
+                await self._client.close()
+                LOGGER.info("Elasticsearch async client closed.")
+            except Exception:
+                LOGGER.exception("Error closing Elasticsearch async client.")
+            self._client = None
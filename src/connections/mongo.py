@@ -13,31 +13,174 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import atexit
 import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
 
-from pymongo import MongoClient
+import bson
+from bson import Decimal128, ObjectId, json_util
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    MongoClient,
+    ReplaceOne,
+    UpdateMany,
+    UpdateOne,
+)
 from pymongo.database import Database
-from pymongo.errors import ExecutionTimeout, NetworkTimeout
+from pymongo.errors import (
+    BulkWriteError,
+    CursorNotFound,
+    ExecutionTimeout,
+    NetworkTimeout,
+)
 from typica import DBConnectionMeta
 
-from src.configs import CustomLogLevel, project_meta
+from src.configs import CustomLogLevel, config, project_meta
+from src.configs.env import MongoConfig
+from src.connections.utils.batching import iter_parallel
+from src.connections.utils.exporters import EXPORT_FORMATS, write_documents
+from src.connections.utils.sinks import Sink
 
 LOGGER = logging.getLogger(project_meta.name)
 
+_CLIENTS: dict[tuple, MongoClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(uri: str, **options: Any) -> MongoClient:
+    """
+    Return the process-wide ``MongoClient`` for ``uri`` and ``options``.
+
+    Clients are created once and kept until :func:`close_all_clients`, so
+    connectors share warmed pools instead of redoing SRV lookup, TLS and
+    server discovery.
+    """
+    key = (uri, tuple(sorted((k, str(v)) for k, v in options.items())))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = MongoClient(uri, **options)
+        return client
+
+
+def close_all_clients() -> None:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_all_clients)
+
+WriteOp = InsertOne | ReplaceOne | UpdateOne | UpdateMany | DeleteOne | DeleteMany
+
+
+@dataclass
+class BulkWriteStats:
+    batch: int
+    ops: int
+    inserted: int = 0
+    upserted: int = 0
+    matched: int = 0
+    modified: int = 0
+    deleted: int = 0
+    elapsed: float = 0.0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.elapsed if self.elapsed else 0.0
+
+
+def _op_size(op: WriteOp) -> int:
+    """Approximate BSON size of a write, from the documents the op carries."""
+    size = 0
+    for attr in ("_doc", "_filter"):
+        doc = getattr(op, attr, None)
+        if isinstance(doc, dict):
+            size += len(bson.encode(doc))
+    return size
+
+
+def _iter_op_batches(
+    ops: Iterable[WriteOp], max_ops: int, max_bytes: int
+) -> Iterator[list[WriteOp]]:
+    """Cut ops into batches bounded by both count and approximate BSON bytes."""
+    batch, size = [], 0
+    for op in ops:
+        op_size = _op_size(op)
+        if batch and (len(batch) >= max_ops or size + op_size > max_bytes):
+            yield batch
+            batch, size = [], 0
+        batch.append(op)
+        size += op_size
+    if batch:
+        yield batch
+
+
+def _to_columnar(doc: dict[str, Any]) -> dict[str, Any]:
+    """Replace top-level BSON-only values that Arrow can't infer."""
+    return {
+        k: str(v)
+        if isinstance(v, ObjectId)
+        else v.to_decimal()
+        if isinstance(v, Decimal128)
+        else v
+        for k, v in doc.items()
+    }
+
+
+def _load_resume_token(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    return json_util.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_resume_token(path: Path, token: dict[str, Any]) -> None:
+    """Write the token next to ``path`` and rename it over, so a crash never leaves half a file."""
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json_util.dumps(token))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
 
 class MongoConnector:
     _meta: DBConnectionMeta
     _client: MongoClient
     _db: Database
 
-    def __init__(self, meta: DBConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: DBConnectionMeta,
+        client_config: MongoConfig | None = None,
+        shared: bool = True,
+    ) -> None:
         """
         Initialize the Mongo connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: DBConnectionMeta
+        :param client_config: Pool settings, defaults to ``config.mongo``.
+        :param shared: Reuse the process-wide client of this URI instead of
+            creating one owned (and closed) by this connector.
         """
         self._meta = meta
+        self._client_config = client_config or config.mongo
+        self._shared = shared
         if not self._meta.uri:
             self._meta.uri = self._meta.uri_string(base="mongodb", with_db=False)
 
@@ -66,13 +209,30 @@ class MongoConnector:
         """
         Establish a connection to the MongoDB server.
 
-        :param kwargs: Additional keyword arguments for MongoClient.
+        :param kwargs: Additional keyword arguments for MongoClient, on top
+            of the pool settings from ``client_config``.
         :raises ValueError: If the connection to the MongoDB server fails.
         :raises Exception: If any other error occurs during the connection.
         """
 
+        client_config = self._client_config
+        options: dict[str, Any] = {
+            "maxPoolSize": client_config.max_pool_size,
+            "minPoolSize": client_config.min_pool_size,
+            "readPreference": client_config.read_preference,
+            "serverSelectionTimeoutMS": client_config.server_selection_timeout_ms,
+        }
+        if client_config.max_idle_time_ms is not None:
+            options["maxIdleTimeMS"] = client_config.max_idle_time_ms
+        if client_config.compressors:
+            options["compressors"] = client_config.compressors
+        options.update(kwargs)
+
         try:
-            self._client = MongoClient(self._meta.uri, **kwargs)
+            if self._shared:
+                self._client = get_client(self._meta.uri, **options)
+            else:
+                self._client = MongoClient(self._meta.uri, **options)
             self._db = self._client[str(self._meta.database)]
             LOGGER.log(CustomLogLevel.CONNECTION, "Mongo connected.")
         except (NetworkTimeout, ExecutionTimeout) as e:
@@ -80,13 +240,384 @@ class MongoConnector:
         except Exception as e:
             raise e
 
+    def _bulk_batch(
+        self, collection: str, batch: int, ops: list[WriteOp]
+    ) -> BulkWriteStats:
+        stats = BulkWriteStats(batch=batch, ops=len(ops))
+        started = time.monotonic()
+        try:
+            result = self._db[collection].bulk_write(ops, ordered=False)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+            stats.errors = [
+                {"index": err["index"], "code": err["code"], "errmsg": err["errmsg"]}
+                for err in details.get("writeErrors", [])
+            ]
+            if details.get("writeConcernErrors"):
+                stats.errors.extend(details["writeConcernErrors"])
+        stats.elapsed = time.monotonic() - started
+        stats.inserted = details.get("nInserted", 0)
+        stats.upserted = details.get("nUpserted", 0)
+        stats.matched = details.get("nMatched", 0)
+        stats.modified = details.get("nModified", 0)
+        stats.deleted = details.get("nRemoved", 0)
+        return stats
+
+    def bulk_write(
+        self,
+        collection: str,
+        operations: Iterable[dict[str, Any] | WriteOp],
+        upsert_key: str | list[str] | None = None,
+        max_ops: int = 1000,
+        max_bytes: int = 8 * 1024 * 1024,
+        max_workers: int = 3,
+    ) -> Iterator[BulkWriteStats]:
+        """
+        Write a stream of documents or operations with unordered ``bulk_write`` calls.
+
+        Plain documents become ``InsertOne``, or ``ReplaceOne(..., upsert=True)``
+        filtered on ``upsert_key`` when it is given; pymongo operations are
+        passed through. Operations are cut into batches of at most
+        ``max_ops`` operations and ``max_bytes`` BSON bytes, and up to
+        ``max_workers`` batches are written concurrently. At most
+        ``2 * max_workers`` batches are buffered, so the input is consumed
+        lazily.
+
+        Failed writes don't stop the stream: their ``index`` (within the
+        batch), ``code`` and ``errmsg`` are reported in the batch stats.
+
+        :param collection: Target collection.
+        :param operations: Documents or pymongo write operations.
+        :param upsert_key: Field(s) identifying a document for upserts.
+        :param max_ops: Operations per batch.
+        :param max_bytes: Approximate BSON bytes per batch.
+        :param max_workers: Batches written concurrently.
+        :return: Iterator of per-batch stats, in input order.
+        """
+        keys = [upsert_key] if isinstance(upsert_key, str) else upsert_key
+
+        def _to_op(item: dict[str, Any] | WriteOp) -> WriteOp:
+            if not isinstance(item, dict):
+                return item
+            if keys:
+                return ReplaceOne({k: item[k] for k in keys}, item, upsert=True)
+            return InsertOne(item)
+
+        batches = _iter_op_batches(map(_to_op, operations), max_ops, max_bytes)
+        pending = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mongo-bulk"
+        )
+        try:
+            for batch, ops in enumerate(batches):
+                pending.append(
+                    executor.submit(self._bulk_batch, collection, batch, ops)
+                )
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def split_id_ranges(
+        self,
+        collection: str,
+        partitions: int,
+        query: dict[str, Any] | None = None,
+        samples_per_partition: int = 100,
+    ) -> list[tuple[Any, Any]]:
+        """
+        Split a collection into ``_id`` ranges holding about the same number of documents.
+
+        Boundaries are quantiles of a ``$sample`` of ``_id`` values, so this
+        works on any deployment (``splitVector`` needs cluster privileges and
+        doesn't run through mongos). Range queries compare ``_id`` within one
+        BSON type, so collections mixing ``_id`` types should use one partition.
+
+        :return: ``(lower, upper)`` pairs; ``None`` is an open end.
+        """
+        if partitions <= 1:
+            return [(None, None)]
+        pipeline: list[dict[str, Any]] = [{"$match": query}] if query else []
+        pipeline += [
+            {"$sample": {"size": partitions * samples_per_partition}},
+            {"$project": {"_id": 1}},
+            {"$sort": {"_id": 1}},
+        ]
+        ids = [
+            doc["_id"]
+            for doc in self._db[collection].aggregate(pipeline, allowDiskUse=True)
+        ]
+
+        bounds: list[Any] = []
+        for i in range(1, partitions):
+            if ids and (bound := ids[len(ids) * i // partitions]) not in bounds:
+                bounds.append(bound)
+        edges = [None, *bounds, None]
+        return list(zip(edges[:-1], edges[1:], strict=False))
+
+    def _iter_id_range(
+        self,
+        collection: str,
+        lower: Any,
+        upper: Any,
+        query: dict[str, Any] | None,
+        projection: dict[str, Any] | list[str] | None,
+        batch_size: int,
+        session_refresh: float,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Read one ``_id`` range in ``_id`` order on its own session.
+
+        The cursor is opened with ``no_cursor_timeout`` and its session is
+        refreshed every ``session_refresh`` seconds, since the server still
+        reaps cursors of expired sessions. If the cursor is lost anyway the
+        read resumes after the last ``_id`` seen, so ``_id`` is always fetched
+        and only stripped afterwards when ``projection`` excludes it.
+        """
+        strip_id = isinstance(projection, dict) and not projection.get("_id", True)
+        if strip_id:
+            projection = {k: v for k, v in projection.items() if k != "_id"} or None
+        last_id = None
+        while True:
+            id_filter: dict[str, Any] = {}
+            if lower is not None:
+                id_filter["$gte"] = lower
+            if last_id is not None:
+                id_filter = {"$gt": last_id}
+            if upper is not None:
+                id_filter["$lt"] = upper
+            filters = [
+                f for f in (query, {"_id": id_filter} if id_filter else None) if f
+            ]
+            criteria = (
+                {"$and": filters}
+                if len(filters) > 1
+                else (filters[0] if filters else {})
+            )
+
+            with self._client.start_session() as session:
+                cursor = (
+                    self._db[collection]
+                    .find(
+                        criteria,
+                        projection,
+                        no_cursor_timeout=True,
+                        batch_size=batch_size,
+                        session=session,
+                    )
+                    .sort("_id", 1)
+                )
+                refreshed = time.monotonic()
+                try:
+                    for doc in cursor:
+                        last_id = doc.pop("_id") if strip_id else doc["_id"]
+                        yield doc
+                        if time.monotonic() - refreshed > session_refresh:
+                            self._client.admin.command(
+                                "refreshSessions", [session.session_id], session=session
+                            )
+                            refreshed = time.monotonic()
+                    return
+                except CursorNotFound:
+                    LOGGER.warning(
+                        f"Mongo cursor lost on {collection}, resuming after {last_id}."
+                    )
+                finally:
+                    cursor.close()
+
+    def _range_sources(
+        self,
+        collection: str,
+        query: dict[str, Any] | None,
+        projection: dict[str, Any] | list[str] | None,
+        partitions: int,
+        batch_size: int,
+        session_refresh: float,
+    ) -> list[Callable[[], Iterator[dict[str, Any]]]]:
+        return [
+            partial(
+                self._iter_id_range,
+                collection,
+                lower,
+                upper,
+                query,
+                projection,
+                batch_size,
+                session_refresh,
+            )
+            for lower, upper in self.split_id_ranges(collection, partitions, query)
+        ]
+
+    def scan_collection(
+        self,
+        collection: str,
+        query: dict[str, Any] | None = None,
+        projection: dict[str, Any] | list[str] | None = None,
+        partitions: int = 4,
+        batch_size: int = 1_000,
+        session_refresh: float = 300.0,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream every document of ``collection`` matching ``query``.
+
+        The collection is split with :meth:`split_id_ranges` and each range is
+        read by its own cursor in a parallel thread; documents are yielded in
+        arrival order.
+
+        :param projection: Fields to return.
+        :param partitions: Number of ``_id`` ranges read in parallel.
+        :param batch_size: Documents per cursor batch.
+        :param session_refresh: Seconds between ``refreshSessions`` calls.
+        """
+        sources = self._range_sources(
+            collection, query, projection, partitions, batch_size, session_refresh
+        )
+        if len(sources) == 1:
+            yield from sources[0]()
+        else:
+            yield from iter_parallel(sources, buffer_size=batch_size * len(sources))
+
+    def export_collection(
+        self,
+        collection: str,
+        output_dir: str | Path,
+        fmt: str = "ndjson",
+        query: dict[str, Any] | None = None,
+        projection: dict[str, Any] | list[str] | None = None,
+        partitions: int = 4,
+        batch_size: int = 1_000,
+        session_refresh: float = 300.0,
+    ) -> dict[Path, int]:
+        """
+        Dump a collection to one file per ``_id`` range, ranges are written in parallel.
+
+        NDJSON writes BSON values with ``str``; for Parquet, top-level
+        ``ObjectId`` and ``Decimal128`` values are converted to ``str`` and
+        ``Decimal``.
+
+        :param fmt: ``"ndjson"`` or ``"parquet"``.
+        :return: Number of documents written per file.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"fmt must be one of {EXPORT_FORMATS}.")
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        sources = self._range_sources(
+            collection, query, projection, partitions, batch_size, session_refresh
+        )
+        paths = [
+            output_dir / f"{collection}-{i:04d}.{fmt}" for i in range(len(sources))
+        ]
+
+        def _write(path: Path, source: Callable[[], Iterator[dict]]) -> int:
+            docs = source()
+            if fmt == "parquet":
+                docs = map(_to_columnar, docs)
+            return write_documents(path, docs, fmt)
+
+        with ThreadPoolExecutor(
+            max_workers=len(sources), thread_name_prefix="mongo-export"
+        ) as executor:
+            counts = list(executor.map(_write, paths, sources))
+
+        LOGGER.info(f"Exported {sum(counts)} documents from {collection}.")
+        return dict(zip(paths, counts, strict=True))
+
+    def tail_changes(
+        self,
+        sink: Sink,
+        collection: str | None = None,
+        pipeline: list[dict[str, Any]] | None = None,
+        full_document: str | None = None,
+        batch_size: int = 500,
+        max_wait: float = 1.0,
+        checkpoint_path: str | Path | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> int:
+        """
+        Tail a change stream and hand micro-batches of events to ``sink``.
+
+        A batch is flushed when it holds ``batch_size`` events or its oldest
+        event is ``max_wait`` seconds old. The stream's resume token is
+        written to ``checkpoint_path`` only after ``sink`` returns, and the
+        stream resumes from it on the next run, so every event reaches the
+        sink at least once. If ``sink`` raises, the error propagates without
+        checkpointing that batch. The pending batch is also flushed when the
+        stream is invalidated by a drop or rename; resuming uses
+        ``startAfter`` (MongoDB 4.2+) so the next run starts past it.
+
+        :param sink: Callable taking a list of change events, see
+            ``src.connections.utils.sinks`` for Kafka, RMQ and Postgres adapters.
+        :param collection: Collection to watch, the whole database when ``None``.
+        :param pipeline: Extra aggregation stages, e.g. a ``$match`` on ``operationType``.
+        :param full_document: ``"updateLookup"`` to attach the current document to updates.
+        :param batch_size: Maximum events per sink call.
+        :param max_wait: Maximum seconds an event waits before its batch is flushed.
+        :param checkpoint_path: Resume token file, defaults to
+            ``./data/<database>[.<collection>].resume_token.json``.
+        :param stop_event: Set it to flush the current batch and stop.
+        :return: Number of events delivered to the sink.
+        """
+        if checkpoint_path is None:
+            name = ".".join(filter(None, (str(self._meta.database), collection)))
+            checkpoint_path = Path("data") / f"{name}.resume_token.json"
+        checkpoint_path = Path(checkpoint_path)
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        stop_event = stop_event or threading.Event()
+
+        target = self._db[collection] if collection else self._db
+        resume_token = _load_resume_token(checkpoint_path)
+        if resume_token is not None:
+            LOGGER.info(f"Resuming change stream from {checkpoint_path}.")
+
+        delivered = 0
+        with target.watch(
+            pipeline or [],
+            full_document=full_document,
+            start_after=resume_token,
+            batch_size=batch_size,
+            max_await_time_ms=max(1, int(max_wait * 1000)),
+        ) as stream:
+            batch: list[dict[str, Any]] = []
+            deadline = 0.0
+            while stream.alive and not stop_event.is_set():
+                change = stream.try_next()
+                if change is not None:
+                    if not batch:
+                        deadline = time.monotonic() + max_wait
+                    batch.append(change)
+                if batch and (len(batch) >= batch_size or time.monotonic() >= deadline):
+                    sink(batch)
+                    _save_resume_token(checkpoint_path, stream.resume_token)
+                    delivered += len(batch)
+                    batch = []
+
+            # Stopped, or the stream was invalidated (drop, rename): flush the
+            # tail. ``start_after`` lets the next run resume past an invalidate.
+            if batch:
+                sink(batch)
+                _save_resume_token(checkpoint_path, stream.resume_token)
+                delivered += len(batch)
+
+        LOGGER.info(f"Change stream stopped after {delivered} events.")
+        return delivered
+
     def close(self) -> None:
         """
         Close the connection to the MongoDB server.
 
+        A shared client stays open for other connectors and is closed at
+        interpreter exit.
+
         This method is a no-op if the connection is already closed.
         """
-        if hasattr(self, "_client") and self._client:
+        if hasattr(self, "_client") and self._client and not self._shared:
             self._client.close()
+        self._client = None
 
         LOGGER.log(CustomLogLevel.CONNECTION, "Mongo disconnected.")
@@ -13,25 +13,110 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import io
 import logging
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from pandas import DataFrame
-from sqlalchemy import URL, Connection, Engine, create_engine, text
+import pyarrow as pa
+from pandas import ArrowDtype, DataFrame
+from psycopg import sql
+from psycopg.pq import TransactionStatus
+from pyarrow import csv as pa_csv
+from sqlalchemy import (
+    URL,
+    Connection,
+    Engine,
+    Executable,
+    TextClause,
+    bindparam,
+    create_engine,
+    text,
+)
+from sqlalchemy.exc import DataError, IntegrityError
 from typica import BaseConnector, DBConnectionMeta
 
-from src.configs import CustomLogLevel, project_meta
+from src.configs import CustomLogLevel, config, project_meta
+from src.configs.env import PGAlchemyConfig
+from src.connections.utils.batching import iter_batches
 
 LOGGER = logging.getLogger(project_meta.name)
 
+# PostgreSQL type OID -> Arrow type, anything else is left to Arrow inference
+ARROW_TYPES: dict[int, pa.DataType] = {
+    16: pa.bool_(),
+    20: pa.int64(),
+    21: pa.int16(),
+    23: pa.int32(),
+    25: pa.string(),
+    700: pa.float32(),
+    701: pa.float64(),
+    1042: pa.string(),
+    1043: pa.string(),
+    1082: pa.date32(),
+    1114: pa.timestamp("us"),
+    1184: pa.timestamp("us", tz="UTC"),
+    1700: pa.float64(),  # unconstrained numeric, typed ones become decimal128
+    2950: pa.string(),
+    3802: pa.string(),
+}
+
+
+@lru_cache(maxsize=512)
+def _text(query: str) -> TextClause:
+    """Parse a SQL string into a ``TextClause`` once per distinct string."""
+    return text(query)
+
+
+@dataclass
+class BulkExecuteResult:
+    """Outcome of ``execute_many``, ``failed`` holds ``(input position, error)``."""
+
+    executed: int = 0
+    batches: int = 0
+    failed: list[tuple[int, str]] = field(default_factory=list)
+
+
+class _CopyReader(io.RawIOBase):
+    """Read-only file object over the chunks of a ``COPY ... TO STDOUT``."""
+
+    def __init__(self, chunks: Iterator[Any]) -> None:
+        self._chunks = chunks
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(bytes(chunk))
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
 
 class PostgreAlchemyConnector(BaseConnector):
     _meta: DBConnectionMeta
     _conn: Connection | None = None
     _engine: Engine | None = None
 
-    def __init__(self, meta: DBConnectionMeta) -> None:
+    def __init__(
+        self, meta: DBConnectionMeta, engine_config: PGAlchemyConfig | None = None
+    ) -> None:
+        """
+        :param meta: The metadata of the database connection.
+        :param engine_config: Pool and statement settings, defaults to
+            ``config.pg_alchemy``.
+        """
         self._meta = meta
+        engine_config = engine_config or config.pg_alchemy
         # Build the engine immediately, but don't connect yet
         connection_url = URL.create(
             drivername="postgresql+psycopg",
@@ -41,8 +126,19 @@ class PostgreAlchemyConnector(BaseConnector):
             port=self._meta.port,
             database=str(self._meta.database),
         )
-        # pool_pre_ping is vital for long-running streaming pipelines
-        self._engine = create_engine(connection_url, pool_pre_ping=True)
+        # pool_pre_ping is vital for long-running streaming pipelines, but costs
+        # a round trip per checkout; pool_recycle alone may be enough elsewhere
+        self._engine = create_engine(
+            connection_url,
+            pool_size=engine_config.pool_size,
+            max_overflow=engine_config.max_overflow,
+            pool_timeout=engine_config.pool_timeout,
+            pool_recycle=engine_config.pool_recycle,
+            pool_pre_ping=engine_config.pool_pre_ping,
+            pool_use_lifo=engine_config.pool_use_lifo,
+            insertmanyvalues_page_size=engine_config.insertmanyvalues_page_size,
+            connect_args={"prepare_threshold": engine_config.prepare_threshold},
+        )
 
     def __enter__(self):
         """Standard Python Context Manager entry."""
@@ -90,23 +186,159 @@ class PostgreAlchemyConnector(BaseConnector):
 
     def get(self, query: str, **params):
         if self._is_connected():
-            result = self._conn.execute(text(query), params)
+            result = self._conn.execute(_text(query), params)
             return result.fetchone()
         raise ConnectionError("Database not connected.")
 
     def get_all(self, query: str, as_dataframe: bool = False, **params):
         if self._is_connected():
-            result = self._conn.execute(text(query), params)
+            result = self._conn.execute(_text(query), params)
             if as_dataframe:
                 return DataFrame(result.fetchall(), columns=result.keys())
             return result.fetchall()
         raise ConnectionError("Database not connected.")
 
+    def stream_all(
+        self, query: str, chunk_size: int = 10_000, as_dataframe: bool = False, **params
+    ) -> Iterator[Sequence[Any] | DataFrame]:
+        """
+        Stream a result set in chunks through a server-side cursor.
+
+        Only ``chunk_size`` rows are held in memory at a time, so tables that
+        don't fit in RAM can be exported chunk by chunk.
+
+        :param query: SQL query, bind parameters as ``:name``.
+        :param chunk_size: Rows fetched per round trip and yielded per chunk.
+        :param as_dataframe: Yield a ``DataFrame`` per chunk instead of rows.
+        """
+        if not self._is_connected():
+            raise ConnectionError("Database not connected.")
+        result = self._conn.execute(
+            _text(query),
+            params,
+            execution_options={"stream_results": True, "yield_per": chunk_size},
+        )
+        try:
+            columns = list(result.keys())
+            for chunk in result.partitions(chunk_size):
+                yield DataFrame(chunk, columns=columns) if as_dataframe else chunk
+        finally:
+            result.close()
+
+    def _literal_sql(self, query: str, **params) -> str:
+        statement = _text(query).bindparams(
+            *(
+                bindparam(k, v, expanding=True)
+                for k, v in params.items()
+                if isinstance(v, list | tuple)
+            ),
+            **{k: v for k, v in params.items() if not isinstance(v, list | tuple)},
+        )
+        return str(
+            statement.compile(
+                dialect=self._engine.dialect, compile_kwargs={"literal_binds": True}
+            )
+        )
+
+    def _arrow_column_types(
+        self, cur: Any, statement: sql.SQL
+    ) -> dict[str, pa.DataType]:
+        cur.execute(sql.SQL("SELECT * FROM ({}) AS _q LIMIT 0").format(statement), ())
+        column_types = {}
+        for col in cur.description:
+            if col.type_code == 1700 and col.precision and col.precision <= 38:
+                column_types[col.name] = pa.decimal128(col.precision, col.scale or 0)
+            elif col.type_code in ARROW_TYPES:
+                column_types[col.name] = ARROW_TYPES[col.type_code]
+        return column_types
+
+    @contextmanager
+    def _arrow_reader(
+        self, query: str, block_size: int = 16 << 20, **params
+    ) -> Iterator[pa_csv.CSVStreamingReader]:
+        """
+        Run ``COPY (query) TO STDOUT`` and open its CSV output as an Arrow reader.
+
+        The session time zone is switched to UTC for the copy, so timestamptz
+        values decode unambiguously, and put back afterwards.
+        """
+        if not self._is_connected():
+            raise ConnectionError("Database not connected.")
+        statement = sql.SQL(self._literal_sql(query, **params))
+        # Runs in the connection's own transaction, like ``get_all``
+        previous_tz = self._conn.exec_driver_sql("SHOW TimeZone").scalar()
+        self._conn.exec_driver_sql("SET LOCAL TimeZone = 'UTC'")
+        driver_conn = self._conn.connection.driver_connection
+        try:
+            with driver_conn.cursor() as cur:
+                column_types = self._arrow_column_types(cur, statement)
+                copy_sql = sql.SQL("COPY ({}) TO STDOUT (FORMAT csv, HEADER true)")
+                with cur.copy(copy_sql.format(statement), ()) as copy:
+                    yield pa_csv.open_csv(
+                        io.BufferedReader(_CopyReader(iter(copy))),
+                        read_options=pa_csv.ReadOptions(block_size=block_size),
+                        convert_options=pa_csv.ConvertOptions(
+                            column_types=column_types,
+                            # Only PG's unquoted empty field is NULL, not "NA" etc.
+                            null_values=[""],
+                            true_values=["t"],
+                            false_values=["f"],
+                            strings_can_be_null=True,
+                            quoted_strings_can_be_null=False,
+                        ),
+                    )
+        finally:
+            # An aborted transaction drops the SET LOCAL on rollback anyway
+            if driver_conn.info.transaction_status != TransactionStatus.INERROR:
+                self._conn.exec_driver_sql(
+                    "SELECT set_config('TimeZone', %(tz)s, true)", {"tz": previous_tz}
+                )
+
+    def stream_arrow(
+        self, query: str, block_size: int = 16 << 20, **params
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream a query as Arrow record batches, without per-cell Python objects.
+
+        The query runs as ``COPY (query) TO STDOUT`` and the CSV output is
+        decoded column-wise by Arrow, typed from the result description
+        (unknown types are inferred). Parameters are rendered as literals.
+
+        :param query: SQL query, bind parameters as ``:name``.
+        :param block_size: Bytes decoded per record batch.
+        """
+        with self._arrow_reader(query, block_size, **params) as reader:
+            yield from reader
+
+    def get_arrow(
+        self, query: str, as_dataframe: bool = False, **params
+    ) -> pa.Table | DataFrame:
+        """
+        Fetch a query into a ``pyarrow.Table``.
+
+        An empty result keeps the columns of the result description; columns
+        of types Arrow can't infer without rows are typed as strings.
+
+        :param as_dataframe: Return an Arrow-backed ``DataFrame`` instead.
+        """
+        with self._arrow_reader(query, **params) as reader:
+            table = reader.read_all()
+        if not table.num_rows:
+            table = table.cast(
+                pa.schema(
+                    f.with_type(pa.string()) if pa.types.is_null(f.type) else f
+                    for f in table.schema
+                )
+            )
+        if as_dataframe:
+            return table.to_pandas(types_mapper=ArrowDtype)
+        return table
+
     def execute(self, query: str, **params):
         """Executes with automatic commit/rollback."""
         if self._is_connected():
             try:
-                self._conn.execute(text(query), params)
+                self._conn.execute(_text(query), params)
                 self._conn.commit()
             except Exception as e:
                 self._conn.rollback()
@@ -115,6 +347,61 @@ class PostgreAlchemyConnector(BaseConnector):
         else:
             raise ConnectionError("Database not connected.")
 
+    def execute_many(
+        self,
+        query: str | Executable,
+        params_seq: Iterable[dict[str, Any]],
+        page_size: int = 1_000,
+        retry_failed: bool = True,
+    ) -> BulkExecuteResult:
+        """
+        Execute a statement for many parameter sets, committing once per page.
+
+        Each page is sent as one ``executemany`` (batched by psycopg, or by
+        ``insertmanyvalues`` when ``query`` is a Core ``insert()``) inside a
+        savepoint. If the page hits a data or integrity error, the savepoint
+        is rolled back and its rows are retried one by one in their own
+        savepoints, so only the offending rows are skipped.
+
+        :param query: SQL string (``:name`` parameters) or Core statement.
+        :param params_seq: Iterable of parameter dicts.
+        :param page_size: Parameter sets per batch and commit.
+        :param retry_failed: Retry a failed page row by row instead of raising.
+        """
+        if not self._is_connected():
+            raise ConnectionError("Database not connected.")
+        statement = _text(query) if isinstance(query, str) else query
+        result = BulkExecuteResult()
+        offset = 0
+        for page in iter_batches(params_seq, page_size):
+            try:
+                try:
+                    with self._conn.begin_nested():
+                        self._conn.execute(statement, page)
+                    result.executed += len(page)
+                except (DataError, IntegrityError) as e:
+                    if not retry_failed:
+                        raise
+                    LOGGER.warning(f"Batch at {offset} failed, retrying rows: {e}")
+                    for idx, params in enumerate(page, start=offset):
+                        try:
+                            with self._conn.begin_nested():
+                                self._conn.execute(statement, params)
+                            result.executed += 1
+                        except (DataError, IntegrityError) as row_error:
+                            result.failed.append((idx, str(row_error.orig)))
+                self._conn.commit()
+            except Exception as e:
+                self._conn.rollback()
+                LOGGER.error(f"Transaction failed, rolled back: {e}")
+                raise e
+            offset += len(page)
+            result.batches += 1
+
+        if result.failed:
+            LOGGER.warning(f"{len(result.failed)} of {offset} parameter sets failed.")
+        return result
+
     def close(self):
         if self._is_connected():
             self._conn.close()
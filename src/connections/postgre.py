@@ -15,23 +15,55 @@
 
 import logging
 import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Any
+from uuid import UUID
 
 import psycopg
 from dateutil import parser
 from psycopg import (
+    AsyncCursor,
     Connection,
     Cursor,
     DatabaseError,
     OperationalError,
 )
+from psycopg_pool import ConnectionPool, PoolTimeout
 from typica.connection import DBConnectionMeta
 
 from src.configs import project_meta
-from src.connections.utils import pg_queries
+from src.connections.utils import date_parsing, pg_queries
+from src.connections.utils.batching import iter_batches
+from src.connections.utils.pg_catalog import TableMetadata, TableMetadataCache
 
 LOGGER = logging.getLogger(project_meta.name)
 
+# Python types each PG type accepts in binary COPY. Binary dumpers are picked
+# by the column type, so any other value (e.g. "false" for a boolean, a JSON
+# string for jsonb) would be silently mis-encoded; those batches use text.
+BINARY_COPY_TYPES: dict[str, tuple[type, ...]] = {
+    "smallint": (int,),
+    "integer": (int,),
+    "bigint": (int,),
+    "real": (float, int),
+    "double precision": (float, int),
+    "numeric": (Decimal,),
+    "boolean": (bool,),
+    "text": (str,),
+    "character varying": (str,),
+    "character": (str,),
+    "date": (date,),
+    "timestamp without time zone": (datetime,),
+    "timestamp with time zone": (datetime,),
+    "uuid": (UUID,),
+    "json": (dict, list),
+    "jsonb": (dict, list),
+    "bytea": (bytes, bytearray, memoryview),
+}
+
 
 class IngestionError(Exception):
     """Base for domain-level ingestion errors."""
@@ -49,12 +81,22 @@ class ValidationError(IngestionError):
     pass
 
 
-class PostgreConnector:
-    _conn: Connection
-    _cur: Cursor
+class BasePostgreConnector:
+    """
+    Driver-agnostic parts shared by the sync and async PostgreSQL connectors:
+    DSN building, the table metadata catalog and per-batch row preparation.
+    """
 
-    def __init__(self, meta: DBConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: DBConnectionMeta,
+        metadata_ttl: float = 300.0,
+        metadata_cache_size: int = 128,
+    ) -> None:
         self.meta = meta
+        self._catalog = TableMetadataCache(
+            maxsize=metadata_cache_size, ttl=metadata_ttl
+        )
 
         dsn = {
             "dbname": meta.database,
@@ -70,22 +112,194 @@ class PostgreConnector:
         val = re.sub(r"([-/\.])\s+(\d)", r"\1\2", val)
         return val
 
+    def _parse_date(self, col: str, value: str) -> datetime:
+        cleaned_value = self._sanitize_string(value)
+        try:
+            # dayfirst would read ISO "2024-01-02" as 1 February
+            return datetime.fromisoformat(cleaned_value)
+        except ValueError:
+            pass
+        try:
+            return parser.parse(cleaned_value, dayfirst=True)
+        except (ValueError, TypeError, OverflowError) as e:
+            raise DateAnomalyError(f"Column '{col}' has invalid date: '{value}'") from e
+
     def _normalize_row_dates(
         self, row: dict[str, Any], date_cols: set[str]
     ) -> dict[str, Any]:
         for col in date_cols:
             value = row.get(col)
             if isinstance(value, str):
-                cleaned_value = self._sanitize_string(value)
-                try:
-                    parsed_date = parser.parse(cleaned_value, dayfirst=True)
-                    row[col] = parsed_date.isoformat()
-                except (ValueError, TypeError, OverflowError) as e:
-                    raise DateAnomalyError(
-                        f"Column '{col}' has invalid date: '{value}'"
-                    ) from e
+                row[col] = self._parse_date(col, value).isoformat()
         return row
 
+    def _normalize_batch_dates(
+        self,
+        batch: list[dict[str, Any]],
+        date_cols: set[str],
+        formats: dict[str, str | None] | None = None,
+    ) -> None:
+        """
+        Parse string dates of a batch in place, column by column.
+
+        Each column is parsed with one fixed format (detected once and kept
+        in ``formats`` across batches); only values that don't match it go
+        through ``dateutil``. Values stay ``datetime`` objects for COPY.
+        """
+        formats = {} if formats is None else formats
+        for col in date_cols:
+            positions = [
+                i for i, row in enumerate(batch) if isinstance(row.get(col), str)
+            ]
+            if not positions:
+                continue
+            values = [batch[i][col] for i in positions]
+            parsed, formats[col] = date_parsing.parse_dates(values, formats.get(col))
+            for i, value, result in zip(positions, values, parsed, strict=True):
+                batch[i][col] = (
+                    result if result is not None else self._parse_date(col, value)
+                )
+
+    def invalidate_table_metadata(
+        self, schema: str | None = None, table: str | None = None
+    ) -> None:
+        """Forget cached metadata, e.g. after DDL. No arguments clears everything."""
+        self._catalog.invalidate(schema=schema, table=table)
+
+    def _store_table_metadata(
+        self, schema: str, table: str, rows: list[tuple[Any, ...]]
+    ) -> TableMetadata:
+        if not rows:
+            raise ValidationError(f"Table {schema}.{table} does not exist.")
+        metadata = TableMetadata.from_rows(schema, table, rows)
+        self._catalog.put(metadata)
+        return metadata
+
+    def _validate_batch(
+        self, batch: list[dict[str, Any]], required: list[str], offset: int = 0
+    ) -> None:
+        for idx, row in enumerate(batch, start=offset):
+            missing = [c for c in required if row.get(c) is None]
+            if missing:
+                raise ValidationError(
+                    f"Row {idx} is missing required columns: {', '.join(missing)}"
+                )
+
+    def _resolve_columns(
+        self,
+        first_row: dict[str, Any],
+        columns: list[str] | None,
+        column_types: dict[str, str],
+        required: list[str],
+    ) -> list[str]:
+        columns = list(columns or first_row.keys())
+        unknown = [c for c in columns if c not in column_types]
+        if unknown:
+            raise ValidationError(f"Unknown columns for table: {', '.join(unknown)}")
+        absent = [c for c in required if c not in columns]
+        if absent:
+            raise ValidationError(f"Required columns not provided: {', '.join(absent)}")
+        return columns
+
+    def _resolve_load_columns(
+        self,
+        first_row: dict[str, Any],
+        columns: list[str] | None,
+        metadata: TableMetadata,
+        conflict_columns: list[str] | None = None,
+    ) -> list[str]:
+        columns = self._resolve_columns(
+            first_row, columns, metadata.column_types, metadata.required_columns
+        )
+        if conflict_columns is not None:
+            absent = [c for c in conflict_columns if c not in columns]
+            if absent:
+                raise ValidationError(
+                    f"Conflict columns not provided: {', '.join(absent)}"
+                )
+        return columns
+
+    def _binary_types(
+        self,
+        cur: Cursor | AsyncCursor,
+        columns: list[str],
+        column_types: dict[str, str],
+    ) -> list[str] | None:
+        types = [column_types[c] for c in columns]
+        unsupported = [t for t in types if t not in BINARY_COPY_TYPES]
+        if unsupported:
+            LOGGER.info(
+                f"Column types {', '.join(unsupported)} are not binary-safe, "
+                "using text COPY."
+            )
+            return None
+        try:
+            for name in types:
+                cur.adapters.types.get_oid(name)
+        except KeyError:
+            LOGGER.info("Column types are not binary-safe, using text COPY.")
+            return None
+        return types
+
+    def _binary_batch_types(
+        self, batch: list[dict[str, Any]], columns: list[str], types: list[str] | None
+    ) -> list[str] | None:
+        """
+        ``types`` if every value of the batch matches its column's Python
+        types for binary COPY, else ``None`` to load the batch as text.
+        """
+        if types is None:
+            return None
+        for column, pg_type in zip(columns, types, strict=True):
+            accepted = BINARY_COPY_TYPES[pg_type]
+            for row in batch:
+                value = row.get(column)
+                if value is None:
+                    continue
+                if not isinstance(value, accepted):
+                    return None
+                # bool is an int and datetime a date, neither dumps as the other
+                if isinstance(value, bool) and bool not in accepted:
+                    return None
+                if isinstance(value, datetime) and datetime not in accepted:
+                    return None
+        return types
+
+    def _dedupe_batch(
+        self, batch: list[dict[str, Any]], conflict_columns: list[str]
+    ) -> list[dict[str, Any]]:
+        """Keep the last row per conflict key, ON CONFLICT can't touch a row twice."""
+        latest = {tuple(row.get(c) for c in conflict_columns): row for row in batch}
+        return list(latest.values())
+
+    def _prepare_batch(
+        self,
+        batch: list[dict[str, Any]],
+        metadata: TableMetadata,
+        columns: list[str],
+        date_formats: dict[str, str | None],
+        offset: int = 0,
+        conflict_columns: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Validate, normalize dates and (for upserts) dedupe one batch."""
+        self._validate_batch(batch, metadata.required_columns, offset=offset)
+        self._normalize_batch_dates(
+            batch, metadata.datetime_columns.intersection(columns), date_formats
+        )
+        if conflict_columns is not None:
+            return self._dedupe_batch(batch, conflict_columns)
+        return batch
+
+    def _check_upsert_action(self, action: str) -> None:
+        if action not in ("update", "nothing"):
+            raise ValueError("action must be either 'update' or 'nothing'.")
+
+
+class PostgreConnector(BasePostgreConnector):
+    _conn: Connection
+    _cur: Cursor
+    _pool: ConnectionPool | None = None
+
     def connect(self):
         if hasattr(self, "_conn") and self._conn and not self._conn.closed:
             return
@@ -98,7 +312,71 @@ class PostgreConnector:
             LOGGER.exception("Failed to connect to PostgreSQL.")
             raise RuntimeError(f"Connection failure: {e}") from e
 
+    def open_pool(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_idle: float = 600.0,
+        timeout: float = 30.0,
+        check: bool = True,
+    ) -> None:
+        """
+        Switch the connector to pooled mode, backed by ``psycopg_pool``.
+
+        Once open, every bulk and metadata call borrows a connection through
+        :meth:`acquire`, so one connector can be shared by worker threads.
+
+        :param min_size: Connections kept open at all times.
+        :param max_size: Upper bound of connections, callers wait beyond it.
+        :param max_idle: Seconds before an idle connection above ``min_size``
+            is closed.
+        :param timeout: Seconds to wait for a free connection.
+        :param check: Ping connections on checkout and replace broken ones.
+        """
+        if self._pool is not None and not self._pool.closed:
+            return
+        try:
+            self._pool = ConnectionPool(
+                kwargs=self._dsn,
+                min_size=min_size,
+                max_size=max_size,
+                max_idle=max_idle,
+                timeout=timeout,
+                check=ConnectionPool.check_connection if check else None,
+                name=f"pg-{self.meta.host}-{self.meta.database}",
+                open=True,
+            )
+            self._pool.wait(timeout=timeout)
+            LOGGER.info(f"PostgreSQL pool opened ({min_size}-{max_size}).")
+        except (PoolTimeout, OperationalError, DatabaseError) as e:
+            self._pool.close()
+            self._pool = None
+            LOGGER.exception("Failed to open PostgreSQL pool.")
+            raise RuntimeError(f"Connection failure: {e}") from e
+
+    @contextmanager
+    def acquire(self) -> Iterator[tuple[Connection, Cursor]]:
+        """
+        Yield a ``(connection, cursor)`` pair.
+
+        In pooled mode the connection is borrowed from the pool and returned
+        on exit (committed, or rolled back on error); otherwise the shared
+        connection opened by :meth:`connect` is used.
+        """
+        if self._pool is not None and not self._pool.closed:
+            with self._pool.connection() as conn, conn.cursor() as cur:
+                yield conn, cur
+            return
+        self._ensure_connection()
+        yield self._conn, self._cur
+
     def close(self) -> None:
+        if self._pool is not None and not self._pool.closed:
+            try:
+                self._pool.close()
+                LOGGER.info("PostgreSQL pool closed.")
+            except Exception:
+                LOGGER.exception("Error closing pool.")
         if hasattr(self, "_cur") and self._cur:
             try:
                 self._cur.close()
@@ -118,19 +396,245 @@ class PostgreConnector:
         if not hasattr(self, "_cur") or not self._cur:
             self._cur = self._conn.cursor()
 
+    def get_table_metadata(
+        self, schema: str, table: str, refresh: bool = False
+    ) -> TableMetadata:
+        """
+        Return the metadata of a table from the catalog cache.
+
+        On a miss (or when ``refresh`` is set) columns, types, nullability,
+        defaults and primary key are fetched from ``pg_catalog`` in a single
+        query and cached for ``metadata_ttl`` seconds.
+
+        :raises ValidationError: If the table doesn't exist.
+        """
+        if not refresh:
+            metadata = self._catalog.get(schema, table)
+            if metadata is not None:
+                return metadata
+
+        with self.acquire() as (_, cur):
+            cur.execute(
+                pg_queries.format_query_table_metadata(schema=schema, table=table)
+            )
+            rows = cur.fetchall()
+        return self._store_table_metadata(schema, table, rows)
+
+    def refresh_table_metadata(self, schema: str, table: str) -> TableMetadata:
+        return self.get_table_metadata(schema, table, refresh=True)
+
     def _cached_required_columns(self, schema: str, table: str) -> list[str]:
-        self._ensure_connection()
-        self._cur.execute(pg_queries.format_query_required(schema=schema, table=table))
-        return [r[0] for r in self._cur.fetchall()]
+        return self.get_table_metadata(schema, table).required_columns
 
     def _cached_primary_key_columns(self, schema: str, table: str) -> list[str]:
-        self._ensure_connection()
-        self._cur.execute(pg_queries.format_query_primaries(schema=schema, table=table))
-        return [r[0] for r in self._cur.fetchall()]
+        return self.get_table_metadata(schema, table).primary_key_columns
 
     def _get_datetime_columns(self, schema: str, table: str) -> set[str]:
-        self._ensure_connection()
-        self._cur.execute(
-            pg_queries.format_query_get_datetime_column(schema=schema, table=table)
+        return self.get_table_metadata(schema, table).datetime_columns
+
+    def _get_column_types(self, schema: str, table: str) -> dict[str, str]:
+        return self.get_table_metadata(schema, table).column_types
+
+    def _copy_batch(
+        self,
+        cur: Cursor,
+        schema: str,
+        table: str,
+        columns: list[str],
+        batch: list[dict[str, Any]],
+        types: list[str] | None = None,
+    ) -> None:
+        query = pg_queries.format_query_copy_from(
+            schema=schema, table=table, columns=columns, binary=types is not None
+        )
+        with cur.copy(query) as copy:
+            if types is not None:
+                copy.set_types(types)
+            for row in batch:
+                copy.write_row(tuple(row.get(c) for c in columns))
+
+    def _load_batch(
+        self,
+        cur: Cursor,
+        schema: str,
+        table: str,
+        columns: list[str],
+        batch: list[dict[str, Any]],
+        types: list[str] | None = None,
+        conflict_columns: list[str] | None = None,
+        action: str = "update",
+    ) -> None:
+        if conflict_columns is None:
+            self._copy_batch(cur, schema, table, columns, batch, types)
+            return
+
+        staging = f"_stg_{table}"
+        cur.execute(
+            pg_queries.format_query_create_staging(
+                schema=schema, table=table, staging=staging, columns=columns
+            )
+        )
+        self._copy_batch(cur, "pg_temp", staging, columns, batch, types)
+        cur.execute(
+            pg_queries.format_query_merge_staging(
+                schema=schema,
+                table=table,
+                staging=staging,
+                columns=columns,
+                constraint_fields=conflict_columns,
+                action=action,
+            )
+        )
+
+    def _bulk_load(
+        self,
+        schema: str,
+        table: str,
+        rows: Iterable[dict[str, Any]],
+        columns: list[str] | None,
+        batch_size: int,
+        binary: bool,
+        conflict_columns: list[str] | None = None,
+        action: str = "update",
+    ) -> int:
+        metadata = self.get_table_metadata(schema, table)
+
+        total = 0
+        binary_types: list[str] | None = None
+        date_formats: dict[str, str | None] = {}
+        with self.acquire() as (conn, cur):
+            for batch in iter_batches(rows, batch_size):
+                if total == 0:
+                    columns = self._resolve_load_columns(
+                        batch[0], columns, metadata, conflict_columns
+                    )
+                    if binary:
+                        binary_types = self._binary_types(
+                            cur, columns, metadata.column_types
+                        )
+                loaded = len(batch)
+                batch = self._prepare_batch(
+                    batch, metadata, columns, date_formats, total, conflict_columns
+                )
+                types = self._binary_batch_types(batch, columns, binary_types)
+
+                try:
+                    try:
+                        self._load_batch(
+                            cur,
+                            schema,
+                            table,
+                            columns,
+                            batch,
+                            types=types,
+                            conflict_columns=conflict_columns,
+                            action=action,
+                        )
+                    except Exception as e:
+                        # Any dump error falls back to text, lost connections don't
+                        if types is None or isinstance(e, OperationalError):
+                            raise
+                        conn.rollback()
+                        LOGGER.warning(f"Binary COPY failed ({e!r}), retrying as text.")
+                        binary_types = None
+                        self._load_batch(
+                            cur,
+                            schema,
+                            table,
+                            columns,
+                            batch,
+                            conflict_columns=conflict_columns,
+                            action=action,
+                        )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+                total += loaded
+                LOGGER.debug(f"Copied {total} rows into {schema}.{table}.")
+
+        LOGGER.info(f"Loaded {total} rows into {schema}.{table}.")
+        return total
+
+    def copy_rows(
+        self,
+        schema: str,
+        table: str,
+        rows: Iterable[dict[str, Any]],
+        columns: list[str] | None = None,
+        batch_size: int = 10_000,
+        binary: bool = True,
+    ) -> int:
+        """
+        Bulk load rows into a table using ``COPY ... FROM STDIN``.
+
+        Rows are consumed lazily in batches of ``batch_size``. Each batch is
+        validated against the required columns, has its datetime columns
+        normalized, is copied in one round trip and committed on its own.
+
+        Binary COPY is used for a batch when every target column type is in
+        ``BINARY_COPY_TYPES`` and every value is of a Python type matching its
+        column (e.g. ``bool`` for boolean, ``dict`` for jsonb); other batches,
+        and any batch whose binary encoding fails, are loaded as text.
+
+        :param schema: Target schema.
+        :param table: Target table.
+        :param rows: Iterable of row dicts, keyed by column name.
+        :param columns: Columns to load, defaults to the keys of the first row.
+        :param batch_size: Number of rows per COPY and commit.
+        :param binary: Try binary COPY before falling back to text.
+        :return: Number of rows loaded.
+        :raises ValidationError: If a row doesn't match the table metadata.
+        :raises DateAnomalyError: If a datetime column has an unparseable value.
+        """
+        return self._bulk_load(schema, table, rows, columns, batch_size, binary)
+
+    def upsert_rows(
+        self,
+        schema: str,
+        table: str,
+        rows: Iterable[dict[str, Any]],
+        columns: list[str] | None = None,
+        conflict_columns: list[str] | None = None,
+        action: str = "update",
+        batch_size: int = 10_000,
+        binary: bool = True,
+    ) -> int:
+        """
+        Bulk upsert rows through a temporary staging table.
+
+        Each batch is COPY-ed into a session-local temp table (not WAL-logged,
+        dropped on commit), then merged into the target with a single
+        ``INSERT ... SELECT ... ON CONFLICT`` statement. When a batch holds
+        the same key more than once, the last row wins.
+
+        :param schema: Target schema.
+        :param table: Target table.
+        :param rows: Iterable of row dicts, keyed by column name.
+        :param columns: Columns to load, defaults to the keys of the first row.
+        :param conflict_columns: Conflict target, defaults to the primary key.
+        :param action: ``"update"`` to overwrite non-key columns, ``"nothing"``
+            to keep existing rows.
+        :param batch_size: Number of rows per merge and commit.
+        :param binary: Try binary COPY before falling back to text.
+        :return: Number of input rows processed.
+        :raises ValidationError: If a row doesn't match the table metadata or
+            the table has no conflict target.
+        :raises DateAnomalyError: If a datetime column has an unparseable value.
+        """
+        self._check_upsert_action(action)
+        if not conflict_columns:
+            conflict_columns = self._cached_primary_key_columns(schema, table)
+        if not conflict_columns:
+            raise ValidationError(f"Table {schema}.{table} has no primary key.")
+        return self._bulk_load(
+            schema,
+            table,
+            rows,
+            columns,
+            batch_size,
+            binary,
+            conflict_columns=conflict_columns,
+            action=action,
         )
-        return {r[0] for r in self._cur.fetchall()}
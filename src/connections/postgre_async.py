@@ -0,0 +1,354 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
+from contextlib import asynccontextmanager
+from typing import Any
+
+from psycopg import AsyncConnection, AsyncCursor, DatabaseError, OperationalError
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from src.configs import project_meta
+from src.connections.postgre import BasePostgreConnector, ValidationError
+from src.connections.utils import pg_queries
+from src.connections.utils.batching import iter_batches
+from src.connections.utils.pg_catalog import TableMetadata
+
+LOGGER = logging.getLogger(project_meta.name)
+
+
+class AsyncPostgreConnector(BasePostgreConnector):
+    """
+    Asyncio counterpart of ``PostgreConnector`` built on ``psycopg.AsyncConnection``.
+
+    Use :meth:`open_pool` and fan queries out with ``asyncio.gather``; a single
+    connection runs one statement at a time.
+    """
+
+    _conn: AsyncConnection | None = None
+    _pool: AsyncConnectionPool | None = None
+
+    async def __aenter__(self) -> "AsyncPostgreConnector":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        if self._conn is not None and not self._conn.closed:
+            return
+        try:
+            self._conn = await AsyncConnection.connect(**self._dsn)
+            LOGGER.info("PostgreSQL async connection established.")
+        except (OperationalError, DatabaseError) as e:
+            LOGGER.exception("Failed to connect to PostgreSQL.")
+            raise RuntimeError(f"Connection failure: {e}") from e
+
+    async def open_pool(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_idle: float = 600.0,
+        timeout: float = 30.0,
+        check: bool = True,
+    ) -> None:
+        """
+        Switch the connector to pooled mode, backed by ``AsyncConnectionPool``.
+
+        Parameters are the same as ``PostgreConnector.open_pool``.
+        """
+        if self._pool is not None and not self._pool.closed:
+            return
+        try:
+            self._pool = AsyncConnectionPool(
+                kwargs=self._dsn,
+                min_size=min_size,
+                max_size=max_size,
+                max_idle=max_idle,
+                timeout=timeout,
+                check=AsyncConnectionPool.check_connection if check else None,
+                name=f"apg-{self.meta.host}-{self.meta.database}",
+                open=False,
+            )
+            await self._pool.open(wait=True, timeout=timeout)
+            LOGGER.info(f"PostgreSQL async pool opened ({min_size}-{max_size}).")
+        except (PoolTimeout, OperationalError, DatabaseError) as e:
+            await self._pool.close()
+            self._pool = None
+            LOGGER.exception("Failed to open PostgreSQL async pool.")
+            raise RuntimeError(f"Connection failure: {e}") from e
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[tuple[AsyncConnection, AsyncCursor]]:
+        """Yield a ``(connection, cursor)`` pair, from the pool when one is open."""
+        if self._pool is not None and not self._pool.closed:
+            async with self._pool.connection() as conn, conn.cursor() as cur:
+                yield conn, cur
+            return
+        await self.connect()
+        async with self._conn.cursor() as cur:
+            yield self._conn, cur
+
+    async def close(self) -> None:
+        if self._pool is not None and not self._pool.closed:
+            try:
+                await self._pool.close()
+                LOGGER.info("PostgreSQL async pool closed.")
+            except Exception:
+                LOGGER.exception("Error closing pool.")
+        if self._conn is not None and not self._conn.closed:
+            try:
+                await self._conn.close()
+                LOGGER.info("PostgreSQL async connection closed.")
+            except Exception:
+                LOGGER.exception("Error closing connection.")
+
+    async def get_table_metadata(
+        self, schema: str, table: str, refresh: bool = False
+    ) -> TableMetadata:
+        """Same as ``PostgreConnector.get_table_metadata``, the cache is per connector."""
+        if not refresh:
+            metadata = self._catalog.get(schema, table)
+            if metadata is not None:
+                return metadata
+
+        async with self.acquire() as (conn, cur):
+            await cur.execute(
+                pg_queries.format_query_table_metadata(schema=schema, table=table)
+            )
+            rows = await cur.fetchall()
+            await conn.commit()
+        return self._store_table_metadata(schema, table, rows)
+
+    async def refresh_table_metadata(self, schema: str, table: str) -> TableMetadata:
+        return await self.get_table_metadata(schema, table, refresh=True)
+
+    async def _cached_required_columns(self, schema: str, table: str) -> list[str]:
+        return (await self.get_table_metadata(schema, table)).required_columns
+
+    async def _cached_primary_key_columns(self, schema: str, table: str) -> list[str]:
+        return (await self.get_table_metadata(schema, table)).primary_key_columns
+
+    async def _get_datetime_columns(self, schema: str, table: str) -> set[str]:
+        return (await self.get_table_metadata(schema, table)).datetime_columns
+
+    async def fetch_one(
+        self, query: Any, params: Sequence | Mapping | None = None
+    ) -> tuple | None:
+        async with self.acquire() as (conn, cur):
+            await cur.execute(query, params)
+            row = await cur.fetchone()
+            await conn.commit()
+        return row
+
+    async def fetch_all(
+        self, query: Any, params: Sequence | Mapping | None = None
+    ) -> list[tuple]:
+        async with self.acquire() as (conn, cur):
+            await cur.execute(query, params)
+            rows = await cur.fetchall()
+            await conn.commit()
+        return rows
+
+    async def executemany(
+        self,
+        query: Any,
+        params_seq: Iterable[Sequence | Mapping],
+        batch_size: int = 1_000,
+    ) -> int:
+        """
+        Run ``query`` for every parameter set in pipeline mode.
+
+        Each batch is sent without waiting for per-statement replies and
+        committed once.
+
+        :return: Number of parameter sets executed.
+        """
+        total = 0
+        async with self.acquire() as (conn, cur):
+            for batch in iter_batches(params_seq, batch_size):
+                try:
+                    async with conn.pipeline():
+                        await cur.executemany(query, batch)
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+                total += len(batch)
+        return total
+
+    async def _copy_batch(
+        self,
+        cur: AsyncCursor,
+        schema: str,
+        table: str,
+        columns: list[str],
+        batch: list[dict[str, Any]],
+        types: list[str] | None = None,
+    ) -> None:
+        query = pg_queries.format_query_copy_from(
+            schema=schema, table=table, columns=columns, binary=types is not None
+        )
+        async with cur.copy(query) as copy:
+            if types is not None:
+                copy.set_types(types)
+            for row in batch:
+                await copy.write_row(tuple(row.get(c) for c in columns))
+
+    async def _load_batch(
+        self,
+        cur: AsyncCursor,
+        schema: str,
+        table: str,
+        columns: list[str],
+        batch: list[dict[str, Any]],
+        types: list[str] | None = None,
+        conflict_columns: list[str] | None = None,
+        action: str = "update",
+    ) -> None:
+        if conflict_columns is None:
+            await self._copy_batch(cur, schema, table, columns, batch, types)
+            return
+
+        staging = f"_stg_{table}"
+        await cur.execute(
+            pg_queries.format_query_create_staging(
+                schema=schema, table=table, staging=staging, columns=columns
+            )
+        )
+        await self._copy_batch(cur, "pg_temp", staging, columns, batch, types)
+        await cur.execute(
+            pg_queries.format_query_merge_staging(
+                schema=schema,
+                table=table,
+                staging=staging,
+                columns=columns,
+                constraint_fields=conflict_columns,
+                action=action,
+            )
+        )
+
+    async def _bulk_load(
+        self,
+        schema: str,
+        table: str,
+        rows: Iterable[dict[str, Any]],
+        columns: list[str] | None,
+        batch_size: int,
+        binary: bool,
+        conflict_columns: list[str] | None = None,
+        action: str = "update",
+    ) -> int:
+        metadata = await self.get_table_metadata(schema, table)
+
+        total = 0
+        binary_types: list[str] | None = None
+        date_formats: dict[str, str | None] = {}
+        async with self.acquire() as (conn, cur):
+            for batch in iter_batches(rows, batch_size):
+                if total == 0:
+                    columns = self._resolve_load_columns(
+                        batch[0], columns, metadata, conflict_columns
+                    )
+                    if binary:
+                        binary_types = self._binary_types(
+                            cur, columns, metadata.column_types
+                        )
+                loaded = len(batch)
+                batch = self._prepare_batch(
+                    batch, metadata, columns, date_formats, total, conflict_columns
+                )
+                types = self._binary_batch_types(batch, columns, binary_types)
+
+                try:
+                    try:
+                        await self._load_batch(
+                            cur,
+                            schema,
+                            table,
+                            columns,
+                            batch,
+                            types=types,
+                            conflict_columns=conflict_columns,
+                            action=action,
+                        )
+                    except Exception as e:
+                        # Any dump error falls back to text, lost connections don't
+                        if types is None or isinstance(e, OperationalError):
+                            raise
+                        await conn.rollback()
+                        LOGGER.warning(f"Binary COPY failed ({e!r}), retrying as text.")
+                        binary_types = None
+                        await self._load_batch(
+                            cur,
+                            schema,
+                            table,
+                            columns,
+                            batch,
+                            conflict_columns=conflict_columns,
+                            action=action,
+                        )
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+
+                total += loaded
+                LOGGER.debug(f"Copied {total} rows into {schema}.{table}.")
+
+        LOGGER.info(f"Loaded {total} rows into {schema}.{table}.")
+        return total
+
+    async def copy_rows(
+        self,
+        schema: str,
+        table: str,
+        rows: Iterable[dict[str, Any]],
+        columns: list[str] | None = None,
+        batch_size: int = 10_000,
+        binary: bool = True,
+    ) -> int:
+        """Async ``PostgreConnector.copy_rows``, see there for the details."""
+        return await self._bulk_load(schema, table, rows, columns, batch_size, binary)
+
+    async def upsert_rows(
+        self,
+        schema: str,
+        table: str,
+        rows: Iterable[dict[str, Any]],
+        columns: list[str] | None = None,
+        conflict_columns: list[str] | None = None,
+        action: str = "update",
+        batch_size: int = 10_000,
+        binary: bool = True,
+    ) -> int:
+        """Async ``PostgreConnector.upsert_rows``, see there for the details."""
+        self._check_upsert_action(action)
+        if not conflict_columns:
+            conflict_columns = await self._cached_primary_key_columns(schema, table)
+        if not conflict_columns:
+            raise ValidationError(f"Table {schema}.{table} has no primary key.")
+        return await self._bulk_load(
+            schema,
+            table,
+            rows,
+            columns,
+            batch_size,
+            binary,
+            conflict_columns=conflict_columns,
+            action=action,
+        )
@@ -13,20 +13,34 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import atexit
 import json
 import logging
+import random
+import signal
 import ssl
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import takewhile
 from ssl import SSLContext
-from typing import Any
+from typing import Any, ClassVar
 
-from pika import BasicProperties, BlockingConnection, SSLOptions
+from pika import BasicProperties, BlockingConnection, SelectConnection, SSLOptions
 from pika.adapters.blocking_connection import BlockingChannel
+from pika.adapters.select_connection import IOLoop
+from pika.channel import Channel
 from pika.connection import ConnectionParameters
 from pika.credentials import PlainCredentials
 from pika.exceptions import (
+    AMQPConnectionError,
     AMQPHeartbeatTimeout,
     ConnectionBlockedTimeout,
-    StreamLostError,
 )
 from typica.connection import RMQConnectionMeta
 
@@ -35,19 +49,556 @@ from src.configs import CustomLogLevel, config, project_meta
 LOGGER = logging.getLogger(project_meta.name)
 
 
+def backoff_delays(base: float, cap: float, attempts: int) -> Iterator[float]:
+    """Exponential backoff with full jitter, so clients don't retry in lockstep."""
+    for attempt in range(attempts):
+        yield random.uniform(0, min(cap, base * 2**attempt))  # noqa: S311
+
+
+class RMQConnectionPool:
+    """
+    One ``BlockingConnection`` per broker shared by every connector in the
+    process, with a pool of reusable channels.
+
+    ``BlockingConnection`` isn't thread-safe, so anything touching the
+    connection or its channels must hold :attr:`lock`. While the connection
+    is otherwise idle a keepalive thread services heartbeats. Reconnects are
+    serialized under the lock and spaced with :func:`backoff_delays`.
+    """
+
+    _registry: ClassVar[dict[tuple, "RMQConnectionPool"]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        parameters: ConnectionParameters,
+        max_channels: int = 32,
+        max_attempts: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+    ) -> None:
+        self.parameters = parameters
+        self.lock = threading.RLock()
+        self._max_channels = max_channels
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._conn: BlockingConnection | None = None
+        self._idle: deque[BlockingChannel] = deque()
+        self._confirming: set[int] = set()
+        self._keepalive: threading.Thread | None = None
+        self._publisher: _ConfirmPublisher | None = None
+        self._closed = threading.Event()
+
+    @classmethod
+    def shared(
+        cls, parameters: ConnectionParameters, **kwargs: Any
+    ) -> "RMQConnectionPool":
+        """Return the process-wide pool for the broker, vhost and user of ``parameters``."""
+        key = (
+            parameters.host,
+            parameters.port,
+            parameters.virtual_host,
+            getattr(parameters.credentials, "username", None),
+            parameters.ssl_options is not None,
+        )
+        with cls._registry_lock:
+            pool = cls._registry.get(key)
+            if pool is None or pool._closed.is_set():
+                pool = cls._registry[key] = cls(parameters, **kwargs)
+            return pool
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._registry_lock:
+            pools = list(cls._registry.values())
+            cls._registry.clear()
+        for pool in pools:
+            pool.close()
+
+    def connection(self) -> BlockingConnection:
+        """The open connection, (re)connecting with backoff when needed."""
+        with self.lock:
+            if self._conn is None or not self._conn.is_open:
+                self._connect()
+            return self._conn
+
+    def _connect(self) -> None:
+        self._idle.clear()
+        self._confirming.clear()
+        error: Exception | None = None
+        delays = backoff_delays(
+            self._backoff_base, self._backoff_max, self._max_attempts
+        )
+        for attempt, delay in enumerate(delays):
+            if attempt:
+                LOGGER.warning(
+                    f"RMQ reconnecting in {delay:.1f}s (attempt {attempt + 1})."
+                )
+                time.sleep(delay)
+            try:
+                self._conn = BlockingConnection(self.parameters)
+                break
+            except AMQPConnectionError as e:
+                LOGGER.error(f"RMQ connection failed: {e!r}")
+                error = e
+        else:
+            raise ConnectionError(
+                f"RMQ unreachable after {self._max_attempts} attempts."
+            ) from error
+
+        LOGGER.log(CustomLogLevel.CONNECTION, "RMQ connected.")
+        if self._keepalive is None or not self._keepalive.is_alive():
+            self._keepalive = threading.Thread(
+                target=self._keepalive_loop, name="rmq-keepalive", daemon=True
+            )
+            self._keepalive.start()
+
+    def _keepalive_loop(self) -> None:
+        interval = max(1.0, (self.parameters.heartbeat or 60) / 3)
+        while not self._closed.wait(interval):
+            with self.lock:
+                if self._conn is None or not self._conn.is_open:
+                    continue
+                try:
+                    self._conn.process_data_events(time_limit=0)
+                except Exception as e:
+                    LOGGER.warning(f"RMQ keepalive failed: {e!r}")
+
+    def acquire_channel(self) -> BlockingChannel:
+        with self.lock:
+            conn = self.connection()
+            while self._idle:
+                channel = self._idle.pop()
+                if channel.is_open:
+                    return channel
+            return conn.channel()
+
+    def release_channel(self, channel: BlockingChannel, reusable: bool = True) -> None:
+        """Return a channel to the pool, or close it when it can't be reused."""
+        with self.lock:
+            if not channel.is_open:
+                self._confirming.discard(channel.channel_number)
+                return
+            if reusable and len(self._idle) < self._max_channels:
+                self._idle.append(channel)
+                return
+            self._confirming.discard(channel.channel_number)
+            channel.close()
+
+    def confirm_delivery(self, channel: BlockingChannel) -> None:
+        """Put a channel in confirm mode once; pooled channels keep the mode."""
+        with self.lock:
+            if channel.channel_number not in self._confirming:
+                channel.confirm_delivery()
+                self._confirming.add(channel.channel_number)
+
+    def confirm_publisher(self) -> "_ConfirmPublisher":
+        """The long-lived confirm-mode publisher of this broker, created on first use."""
+        with self.lock:
+            if self._publisher is None:
+                self._publisher = _ConfirmPublisher(
+                    self.parameters,
+                    max_attempts=self._max_attempts,
+                    backoff_base=self._backoff_base,
+                    backoff_max=self._backoff_max,
+                )
+            return self._publisher
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._publisher is not None:
+            self._publisher.close()
+        with self.lock:
+            self._idle.clear()
+            if self._conn is not None and self._conn.is_open:
+                self._conn.close()
+            self._conn = None
+
+
+atexit.register(RMQConnectionPool.close_all)
+
+
+@dataclass
+class PublishResult:
+    confirmed: int = 0
+    retried: int = 0
+    failed: list[tuple[int, str]] = field(default_factory=list)
+
+
+class _ConfirmPublisher:
+    """
+    Long-lived pipelined publisher on a ``SelectConnection`` with
+    asynchronous confirms.
+
+    The connection and its confirm-mode channel live on an I/O loop thread,
+    which keeps heartbeats going between calls, and are reused by every
+    :meth:`publish`; calls are serialized. Each call keeps up to
+    ``max_outstanding`` unconfirmed messages in flight, tracked by delivery
+    tag. Nacked messages, and everything unconfirmed when the channel or
+    connection drops or confirms stall, are queued again until
+    ``max_retries`` is exhausted. Returned (unroutable) messages fail without
+    retry. While a call is active, a dropped channel or connection is reopened
+    with :func:`backoff_delays`.
+    """
+
+    def __init__(
+        self,
+        parameters: ConnectionParameters,
+        max_attempts: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+    ) -> None:
+        self._parameters = parameters
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._call_lock = threading.Lock()
+        self._ioloop: IOLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._conn: SelectConnection | None = None
+        self._channel: Channel | None = None
+        self._next_tag = 1
+        self._closed = False
+        # Idle state: no call active until publish() starts one.
+        self._reset(iter(()), "", "", BasicProperties(), 1, 0, 0.0)
+        self._finished.set()
+
+    def _reset(
+        self,
+        messages: Iterator[tuple[int, bytes]],
+        exchange: str,
+        routing_key: str,
+        properties: BasicProperties,
+        max_outstanding: int,
+        max_retries: int,
+        confirm_timeout: float,
+    ) -> None:
+        """Start the state of one :meth:`publish` call."""
+        self._messages = messages
+        self._exchange = exchange
+        self._routing_key = routing_key
+        self._properties = properties
+        self._max_outstanding = max_outstanding
+        self._max_retries = max_retries
+        self._confirm_timeout = confirm_timeout
+        self._retry: deque[tuple[int, bytes]] = deque()
+        self._attempts: dict[int, int] = {}
+        self._returned: set[int] = set()
+        self._outstanding: OrderedDict[int, tuple[int, bytes]] = OrderedDict()
+        self._exhausted = False
+        self._last_confirm = time.monotonic()
+        self._delays = backoff_delays(
+            self._backoff_base, self._backoff_max, max(0, self._max_attempts - 1)
+        )
+        self._error: Exception | None = None
+        self._finished = threading.Event()
+        self.result = PublishResult()
+
+    @property
+    def done(self) -> bool:
+        return self._exhausted and not self._retry and not self._outstanding
+
+    def publish(
+        self,
+        messages: Iterator[tuple[int, bytes]],
+        exchange: str,
+        routing_key: str,
+        properties: BasicProperties,
+        max_outstanding: int,
+        max_retries: int,
+        confirm_timeout: float,
+    ) -> PublishResult:
+        """Publish ``(index, body)`` pairs and block until all are settled."""
+        with self._call_lock:
+            if self._closed:
+                raise RuntimeError("RMQ confirm publisher is closed.")
+            self._reset(
+                messages,
+                exchange,
+                routing_key,
+                properties,
+                max_outstanding,
+                max_retries,
+                confirm_timeout,
+            )
+            self._ensure_loop()
+            self._ioloop.add_callback_threadsafe(self._resume)
+            while not self._finished.wait(1.0):
+                if not self._thread.is_alive():
+                    raise ConnectionError("RMQ confirm publisher loop died.")
+            if self._error is not None:
+                raise self._error
+            return self.result
+
+    def _ensure_loop(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._ioloop = IOLoop()
+        self._ioloop.call_later(1.0, self._watchdog)
+        self._thread = threading.Thread(
+            target=self._run_loop, name="rmq-confirm-publisher", daemon=True
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        try:
+            self._ioloop.start()
+        except Exception as e:
+            LOGGER.exception("RMQ confirm publisher loop failed.")
+            self._finish(e)
+        finally:
+            # The connection belonged to this loop, the next one reconnects
+            self._conn = self._channel = None
+            self._finished.set()
+
+    def _resume(self) -> None:
+        """Continue the active call on the open channel, opening it if needed."""
+        if self._finished.is_set():
+            return
+        if self._channel is not None and self._channel.is_open:
+            self._last_confirm = time.monotonic()
+            self._publish()
+        elif self._conn is not None and self._conn.is_open:
+            self._conn.channel(on_open_callback=self._on_channel_open)
+        elif self._conn is None or self._conn.is_closed:
+            self._conn = SelectConnection(
+                self._parameters,
+                on_open_callback=lambda conn: conn.channel(
+                    on_open_callback=self._on_channel_open
+                ),
+                on_open_error_callback=lambda _conn, err: self._on_closed(err),
+                on_close_callback=lambda _conn, err: self._on_closed(err),
+                custom_ioloop=self._ioloop,
+            )
+
+    def _finish(self, error: Exception | None = None) -> None:
+        self._error = error
+        self._finished.set()
+
+    def _on_channel_open(self, channel: Channel) -> None:
+        self._channel = channel
+        self._next_tag = 1
+        channel.add_on_return_callback(self._on_return)
+        channel.add_on_close_callback(self._on_channel_closed)
+        channel.confirm_delivery(ack_nack_callback=self._on_confirm)
+        self._resume()
+
+    def _next_message(self) -> tuple[int, bytes] | None:
+        if self._retry:
+            return self._retry.popleft()
+        if not self._exhausted:
+            try:
+                return next(self._messages)
+            except StopIteration:
+                self._exhausted = True
+        return None
+
+    def _publish(self) -> None:
+        try:
+            while len(self._outstanding) < self._max_outstanding:
+                item = self._next_message()
+                if item is None:
+                    break
+                idx, body = item
+                properties = copy(self._properties)
+                properties.message_id = str(idx)
+                self._channel.basic_publish(
+                    self._exchange, self._routing_key, body, properties, mandatory=True
+                )
+                self._outstanding[self._next_tag] = item
+                self._next_tag += 1
+        except Exception as e:
+            # e.g. a message that can't be serialized: fail the call, not the loop
+            self._finish(e)
+            return
+        if self.done:
+            self._finish()
+
+    def _on_return(self, _channel, _method, properties: BasicProperties, _body) -> None:
+        self._returned.add(int(properties.message_id))
+
+    def _on_confirm(self, frame) -> None:
+        method = frame.method
+        acked = method.NAME == "Basic.Ack"
+        self._last_confirm = time.monotonic()
+        if method.multiple:
+            tags = list(
+                takewhile(lambda t: t <= method.delivery_tag, self._outstanding)
+            )
+        else:
+            tags = (
+                [method.delivery_tag]
+                if method.delivery_tag in self._outstanding
+                else []
+            )
+
+        for tag in tags:
+            idx, body = self._outstanding.pop(tag)
+            if idx in self._returned:
+                self._returned.discard(idx)
+                self.result.failed.append((idx, "unroutable"))
+            elif acked:
+                self.result.confirmed += 1
+            else:
+                self._requeue(idx, body, "nacked")
+        if not self._finished.is_set():
+            self._publish()
+
+    def _requeue(self, idx: int, body: bytes, reason: str) -> None:
+        attempts = self._attempts.get(idx, 0) + 1
+        if attempts > self._max_retries:
+            self.result.failed.append((idx, reason))
+            return
+        self._attempts[idx] = attempts
+        self.result.retried += 1
+        self._retry.append((idx, body))
+
+    def _requeue_outstanding(self, reason: Exception) -> None:
+        while self._outstanding:
+            _, (idx, body) = self._outstanding.popitem(last=False)
+            self._requeue(idx, body, f"unconfirmed: {reason}")
+        self._retry = deque(sorted(self._retry))
+
+    def _watchdog(self) -> None:
+        if (
+            not self._finished.is_set()
+            and self._outstanding
+            and time.monotonic() - self._last_confirm > self._confirm_timeout
+            and self._conn is not None
+            and self._conn.is_open
+        ):
+            LOGGER.warning("RMQ confirms stalled, republishing on a new connection.")
+            self._conn.close()
+        if not self._closed:
+            self._ioloop.call_later(1.0, self._watchdog)
+
+    def _on_channel_closed(self, channel: Channel, reason: Exception) -> None:
+        if channel is not self._channel:
+            return
+        self._channel = None
+        # A dropped connection closes its channels too; _on_closed handles it.
+        if self._conn is not None and self._conn.is_open:
+            LOGGER.warning(f"RMQ publisher channel closed: {reason!r}")
+            self._requeue_outstanding(reason)
+            self._retry_later()
+
+    def _on_closed(self, reason: Exception) -> None:
+        self._conn = self._channel = None
+        self._requeue_outstanding(reason)
+        if self._closed:
+            self._finish(ConnectionError("RMQ confirm publisher closed."))
+            self._ioloop.stop()
+            return
+        if not self._finished.is_set():
+            LOGGER.warning(f"RMQ connection lost while publishing: {reason!r}")
+            self._retry_later()
+
+    def _retry_later(self) -> None:
+        if self._finished.is_set():
+            return
+        if self.done:
+            self._finish()
+            return
+        delay = next(self._delays, None)
+        if delay is None:
+            self._finish(
+                ConnectionError(
+                    f"RMQ publish aborted after {self._max_attempts} connection attempts."
+                )
+            )
+            return
+        self._ioloop.call_later(delay, self._resume)
+
+    def close(self) -> None:
+        self._closed = True
+        if self._thread is None or not self._thread.is_alive():
+            return
+
+        def _shutdown() -> None:
+            if self._conn is not None and not self._conn.is_closed:
+                self._conn.close()
+            else:
+                self._finish(ConnectionError("RMQ confirm publisher closed."))
+                self._ioloop.stop()
+
+        self._ioloop.add_callback_threadsafe(_shutdown)
+        self._thread.join(timeout=10)
+
+
+class _AckBatcher:
+    """
+    Turn out-of-order handler completions into ``multiple=True`` acks.
+
+    Delivery tags on a consumer channel are contiguous, so once every tag up
+    to N is settled a single ack covers them all. Failures are nacked right
+    away and only count towards contiguity. Only used from the connection
+    thread.
+    """
+
+    def __init__(self, channel: BlockingChannel, batch_size: int) -> None:
+        self._channel = channel
+        self._batch_size = batch_size
+        self._settled: dict[int, bool] = {}
+        self._contiguous = 0
+        self._last_ok = 0
+        self._acked = 0
+
+    def settle(self, tag: int, ok: bool, requeue: bool) -> None:
+        if not ok:
+            self._channel.basic_nack(delivery_tag=tag, requeue=requeue)
+        self._settled[tag] = ok
+        while self._contiguous + 1 in self._settled:
+            self._contiguous += 1
+            if self._settled.pop(self._contiguous):
+                self._last_ok = self._contiguous
+        if self._last_ok - self._acked >= self._batch_size:
+            self.flush()
+
+    def flush(self, final: bool = False) -> None:
+        """
+        Ack the contiguous settled range; ``final`` also acks finished tags
+        past a gap left by messages the broker took back on cancel.
+        """
+        if self._last_ok > self._acked:
+            self._channel.basic_ack(delivery_tag=self._last_ok, multiple=True)
+            self._acked = self._last_ok
+        if final:
+            for tag, ok in sorted(self._settled.items()):
+                if ok:
+                    self._channel.basic_ack(delivery_tag=tag)
+            self._settled.clear()
+
+
 class RMQConnector:
     _meta: RMQConnectionMeta
     _conn: BlockingConnection
     _channel: BlockingChannel
+    _pool: RMQConnectionPool | None = None
 
-    def __init__(self, meta: RMQConnectionMeta) -> None:
+    def __init__(
+        self,
+        meta: RMQConnectionMeta,
+        shared: bool = True,
+        heartbeat: int = 60,
+        blocked_connection_timeout: float = 300.0,
+    ) -> None:
         """
         Initialize the RMQ connector with the given connection metadata.
 
         :param meta: The metadata of the database connection.
         :type meta: RMQConnectionMeta
+        :param shared: Borrow a channel from the process-wide connection of
+            this broker instead of opening a dedicated connection.
+        :param heartbeat: AMQP heartbeat timeout in seconds.
+        :param blocked_connection_timeout: Seconds a connection may stay
+            blocked by broker flow control before it is dropped.
         """
         self._meta = meta
+        self._shared = shared
+        self._heartbeat = heartbeat
+        self._blocked_connection_timeout = blocked_connection_timeout
+        self._consumed = False
 
     def __enter__(self) -> "RMQConnector":
         """
@@ -68,6 +619,38 @@ class RMQConnector:
         """
         self.close()
 
+    def _connection_parameters(self, with_ssl: bool = False) -> ConnectionParameters:
+        parameters = ConnectionParameters(
+            host=self._meta.host,
+            port=self._meta.port,
+            virtual_host=self._meta.vhost,
+            heartbeat=self._heartbeat,
+            blocked_connection_timeout=self._blocked_connection_timeout,
+        )
+
+        if self._meta.username and self._meta.password:
+            parameters.credentials = PlainCredentials(
+                username=self._meta.username,
+                password=self._meta.password,
+            )
+        if with_ssl:
+            context: SSLContext = ssl._create_unverified_context()  # noqa: S323
+            parameters.ssl_options = SSLOptions(context=context)
+        return parameters
+
+    def _get_pool(self, with_ssl: bool = False) -> RMQConnectionPool:
+        if self._pool is None:
+            parameters = self._connection_parameters(with_ssl)
+            pool_kwargs = {
+                "max_attempts": (self._meta.max_reconnect_attempts or 0) + 1,
+                "backoff_base": self._meta.reconnect_delay or 1,
+            }
+            if self._shared:
+                self._pool = RMQConnectionPool.shared(parameters, **pool_kwargs)
+            else:
+                self._pool = RMQConnectionPool(parameters, **pool_kwargs)
+        return self._pool
+
     def connect(self, with_ssl: bool = False, use_case: str = "consumer") -> None:
         """
         Establish a connection to the RabbitMQ server.
@@ -80,23 +663,10 @@ class RMQConnector:
         self._meta.validate_use_case(use_case)
 
         try:
-            parameters = ConnectionParameters(
-                host=self._meta.host,
-                port=self._meta.port,
-                virtual_host=self._meta.vhost,
-            )
-
-            if self._meta.username and self._meta.password:
-                parameters.credentials = PlainCredentials(
-                    username=self._meta.username,
-                    password=self._meta.password,
-                )
-            if with_ssl:
-                context: SSLContext = ssl._create_unverified_context()  # noqa: S323
-                parameters.ssl_options = SSLOptions(context=context)
-            self._conn = BlockingConnection(parameters)
-            self._channel = self._conn.channel()
-            LOGGER.log(CustomLogLevel.CONNECTION, "RMQ connected.")
+            self._get_pool(with_ssl)
+            with self._pool.lock:
+                self._conn = self._pool.connection()
+                self._channel = self._pool.acquire_channel()
 
         except (AMQPHeartbeatTimeout, ConnectionBlockedTimeout):
             raise ValueError("RMQ connection timed out.")
@@ -110,13 +680,13 @@ class RMQConnector:
         if not self._meta.routing_key:
             raise ValueError("exchange must be set to setup the producer.")
 
-        self._channel.exchange_declare(
-            exchange=self._meta.exchange,
-            durable=self._meta.exchange_durable,
-            exchange_type=self._meta.exchange_type or "topic",
-        )
-
-        self._channel.confirm_delivery()
+        with self._pool.lock:
+            self._channel.exchange_declare(
+                exchange=self._meta.exchange,
+                durable=self._meta.exchange_durable,
+                exchange_type=self._meta.exchange_type or "topic",
+            )
+            self._pool.confirm_delivery(self._channel)
         LOGGER.log(CustomLogLevel.CONNECTION, "RMQ producer setup is success.")
 
     def setup_client_logger(self):
@@ -132,26 +702,26 @@ class RMQConnector:
                 "Exchange, Routing, and Queue of client Logger must be defined"
             )
 
-        self._channel.exchange_declare(
-            exchange=config.app.client_logger_exchange,
-            durable=True,
-            exchange_type="topic",
-        )
-        self._channel.queue_declare(
-            queue=config.app.client_logger_queue,
-            durable=True,
-            auto_delete=True,
-            arguments={
-                "x-message-ttl": 1000 * 60 * 60 * 2  # 2 Hours
-            },
-        )
-        self._channel.queue_bind(
-            queue=config.app.client_logger_queue,
-            routing_key=config.app.client_logger_route,
-            exchange=config.app.client_logger_exchange,
-        )
-
-        self._channel.confirm_delivery()
+        with self._pool.lock:
+            self._channel.exchange_declare(
+                exchange=config.app.client_logger_exchange,
+                durable=True,
+                exchange_type="topic",
+            )
+            self._channel.queue_declare(
+                queue=config.app.client_logger_queue,
+                durable=True,
+                auto_delete=True,
+                arguments={
+                    "x-message-ttl": 1000 * 60 * 60 * 2  # 2 Hours
+                },
+            )
+            self._channel.queue_bind(
+                queue=config.app.client_logger_queue,
+                routing_key=config.app.client_logger_route,
+                exchange=config.app.client_logger_exchange,
+            )
+            self._pool.confirm_delivery(self._channel)
         LOGGER.log(CustomLogLevel.CONNECTION, "RMQ producer setup is success.")
 
     def setup_consumer(self) -> None:
@@ -161,18 +731,38 @@ class RMQConnector:
         if not self._meta.routing_key or not self._meta.queue:
             raise ValueError("Routing key must be set to consume a message.")
 
-        self._channel.queue_declare(
-            self._meta.queue,
-            durable=self._meta.queue_durable_value,
-            auto_delete=self._meta.queue_auto_delete or False,
-        )
-        self._channel.queue_bind(
-            queue=self._meta.queue,
-            routing_key=self._meta.routing_key,
-            exchange=self._meta.exchange,
-        )
+        with self._pool.lock:
+            self._channel.queue_declare(
+                self._meta.queue,
+                durable=self._meta.queue_durable_value,
+                auto_delete=self._meta.queue_auto_delete or False,
+            )
+            self._channel.queue_bind(
+                queue=self._meta.queue,
+                routing_key=self._meta.routing_key,
+                exchange=self._meta.exchange,
+            )
         LOGGER.log(CustomLogLevel.CONNECTION, "RMQ consumter setup is success.")
 
+    def _encode_message(self, message: Any) -> bytes:
+        if not isinstance(message, str | bytes):
+            try:
+                message = json.dumps(message)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Failed to serialize message to JSON: {e}")
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        return message
+
+    def _message_properties(
+        self, content_encoding: str | None = None
+    ) -> BasicProperties:
+        return BasicProperties(
+            content_type="application/json",
+            content_encoding=content_encoding,
+            delivery_mode=2,
+        )
+
     def produce(
         self,
         message: Any,
@@ -188,54 +778,231 @@ class RMQConnector:
 
         if not self._meta.routing_key:
             raise ValueError("Routing key must be set to produce a message.")
-        if not isinstance(message, str | bytes):
-            try:
-                message = json.dumps(message)
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Failed to serialize message to JSON: {e}")
+        message = self._encode_message(message)
+        properties = self._message_properties(content_encoding)
+
+        publish_kwargs = {
+            "exchange": exchange if exchange else self._meta.exchange,
+            "routing_key": routing_key if routing_key else self._meta.routing_key,
+            "body": message,
+            "mandatory": True,
+            "properties": properties,
+        }
+        try:
+            with self._pool.lock:
+                if not self._channel.is_open:
+                    LOGGER.warning("Channel is closed. Recovering RMQ channel...")
+                    self._recover_producer()
+                self._channel.basic_publish(**publish_kwargs)
+        except Exception as e:
+            LOGGER.error(f"Error during publishing: {e}")
+            with self._pool.lock:
+                self._recover_producer()
 
-        properties = BasicProperties(
-            content_type="application/json",
-            content_encoding=content_encoding,
-            delivery_mode=2,
+                # Retry once after recovering
+                self._channel.basic_publish(**publish_kwargs)
+
+    def _recover_producer(self) -> None:
+        """
+        Replace only what is broken: a new channel when the channel closed, a
+        new connection (with backoff) when the connection dropped.
+        """
+        if self._channel.is_open and self._conn.is_open:
+            return
+        self._pool.release_channel(self._channel, reusable=False)
+        self.connect(use_case="producer", with_ssl=self._meta.with_ssl)
+        self.setup_producer()
+
+    def publish_many(
+        self,
+        messages: Iterable[Any],
+        routing_key: str | None = None,
+        exchange: str | None = None,
+        content_encoding: str | None = None,
+        max_outstanding: int = 1000,
+        max_retries: int = 3,
+        confirm_timeout: float = 30.0,
+    ) -> PublishResult:
+        """
+        Publish many messages with pipelined, asynchronous publisher confirms.
+
+        Unlike :meth:`produce`, publishing doesn't wait for each confirm: up to
+        ``max_outstanding`` messages are in flight on the pool's long-lived
+        ``SelectConnection``, which later calls reuse. Only nacked messages,
+        and those left unconfirmed by a dropped connection or stalled
+        confirms, are published again. The exchange must already exist (see
+        :meth:`setup_producer`).
+
+        :param messages: Messages, serialized like :meth:`produce` does.
+        :param routing_key: Routing key, defaults to the meta routing key.
+        :param exchange: Exchange, defaults to the meta exchange.
+        :param content_encoding: ``content_encoding`` message property.
+        :param max_outstanding: Unconfirmed messages allowed in flight.
+        :param max_retries: Times a message is republished before it fails.
+        :param confirm_timeout: Seconds without any confirm before reconnecting.
+        :return: Confirmed and retried counts, and ``(index, reason)`` of failures.
+        """
+        routing_key = routing_key or self._meta.routing_key
+        if not routing_key:
+            raise ValueError("Routing key must be set to produce a message.")
+
+        publisher = self._get_pool(self._meta.with_ssl).confirm_publisher()
+        result = publisher.publish(
+            ((idx, self._encode_message(msg)) for idx, msg in enumerate(messages)),
+            exchange or self._meta.exchange,
+            routing_key,
+            self._message_properties(content_encoding),
+            max_outstanding=max_outstanding,
+            max_retries=max_retries,
+            confirm_timeout=confirm_timeout,
         )
-        if isinstance(message, str):
-            message = message.encode("utf-8")
+        LOGGER.info(
+            f"RMQ published {result.confirmed} messages "
+            f"({result.retried} retried, {len(result.failed)} failed)."
+        )
+        return result
 
+    def consume(
+        self,
+        handler: Callable[[bytes, BasicProperties], Any],
+        prefetch_count: int = 100,
+        max_workers: int = 4,
+        ordering_key: Callable[[BasicProperties, bytes], Hashable] | None = None,
+        requeue_on_error: bool = False,
+        ack_batch_size: int | None = None,
+        ack_interval: float = 0.5,
+        stop_event: threading.Event | None = None,
+    ) -> int:
+        """
+        Consume the meta queue with handlers running on a thread pool.
+
+        ``basic_qos`` caps unacked deliveries at ``prefetch_count``. Workers
+        hand results back to the connection thread with
+        ``add_callback_threadsafe``; successes are acked in contiguous ranges
+        with ``multiple=True`` (every ``ack_batch_size`` messages or
+        ``ack_interval`` seconds), failures are nacked one by one.
+
+        When ``ordering_key`` is given, messages with the same key always run
+        on the same single-thread worker, so they are handled in delivery
+        order. Messages are otherwise handled in any order.
+
+        SIGTERM/SIGINT (when called from the main thread) or ``stop_event``
+        cancel the consumer, wait for in-flight handlers and flush their acks.
+
+        :param handler: Called with ``(body, properties)``; raising nacks the message.
+        :param prefetch_count: Unacked messages the broker may push to this consumer.
+        :param max_workers: Handler threads.
+        :param ordering_key: Maps a message to its ordering key.
+        :param requeue_on_error: Requeue failed messages instead of dropping / dead-lettering.
+        :param ack_batch_size: Acks per ``multiple=True`` batch, defaults to ``prefetch_count // 4``.
+        :param ack_interval: Seconds between flushes of pending acks.
+        :param stop_event: Set it to stop consuming gracefully.
+        :return: Number of messages handled successfully.
+        """
+        if not hasattr(self, "_channel") or self._channel is None:
+            raise RuntimeError("No channel: _channel has not been initialized.")
+        if not self._meta.queue:
+            raise ValueError("Queue must be set to consume a message.")
+
+        stop_event = stop_event or threading.Event()
+        acks = _AckBatcher(self._channel, ack_batch_size or max(1, prefetch_count // 4))
+        if ordering_key is not None:
+            executors = [
+                ThreadPoolExecutor(1, thread_name_prefix=f"rmq-worker-{i}")
+                for i in range(max_workers)
+            ]
+        else:
+            executors = [
+                ThreadPoolExecutor(max_workers, thread_name_prefix="rmq-worker")
+            ]
+        in_flight = 0
+        handled = 0
+        timer = None
+
+        def _settle(tag: int, ok: bool) -> None:
+            nonlocal in_flight, handled
+            in_flight -= 1
+            handled += ok
+            acks.settle(tag, ok, requeue_on_error)
+
+        def _run(tag: int, body: bytes, properties: BasicProperties) -> None:
+            ok = True
+            try:
+                handler(body, properties)
+            except Exception:
+                LOGGER.exception(f"RMQ handler failed for delivery {tag}.")
+                ok = False
+            self._conn.add_callback_threadsafe(partial(_settle, tag, ok))
+
+        def _on_message(
+            _channel, method, properties: BasicProperties, body: bytes
+        ) -> None:
+            nonlocal in_flight
+            in_flight += 1
+            executor = executors[0]
+            if ordering_key is not None:
+                executor = executors[hash(ordering_key(properties, body)) % max_workers]
+            executor.submit(_run, method.delivery_tag, body, properties)
+
+        def _tick() -> None:
+            nonlocal timer
+            acks.flush()
+            timer = self._conn.call_later(ack_interval, _tick)
+
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                previous_handlers[signum] = signal.signal(
+                    signum, lambda *_: stop_event.set()
+                )
         try:
-            if not self._channel.is_open:
-                LOGGER.warning("Channel is closed. Reconnecting to RMQ...")
-                self.connect(use_case="producer", with_ssl=self._meta.with_ssl)
-                self.setup_producer()
-            self._channel.basic_publish(
-                exchange=exchange if exchange else self._meta.exchange,
-                routing_key=routing_key if routing_key else self._meta.routing_key,
-                body=message,
-                mandatory=True,
-                properties=properties,
-            )
-        except (StreamLostError, Exception) as e:
-            LOGGER.error(f"Error during publishing: {e}")
-            LOGGER.warning("Reconnecting to RMQ...")
-            self.connect(use_case="producer", with_ssl=self._meta.with_ssl)
-            self.setup_producer()
-
-            # Retry once after reconnecting
-            self._channel.basic_publish(
-                exchange=exchange if exchange else self._meta.exchange,
-                routing_key=routing_key if routing_key else self._meta.routing_key,
-                body=message,
-                mandatory=True,
-                properties=properties,
-            )
+            self._consumed = True
+            with self._pool.lock:
+                self._channel.basic_qos(prefetch_count=prefetch_count)
+                consumer_tag = self._channel.basic_consume(
+                    self._meta.queue, _on_message
+                )
+                timer = self._conn.call_later(ack_interval, _tick)
+            LOGGER.log(CustomLogLevel.CONNECTION, f"RMQ consuming {self._meta.queue}.")
+            # Short slices, so producers sharing the connection get the lock in between
+            while not stop_event.is_set():
+                with self._pool.lock:
+                    self._conn.process_data_events(time_limit=0.05)
+
+            LOGGER.info(f"RMQ draining {in_flight} in-flight messages.")
+            with self._pool.lock:
+                self._channel.basic_cancel(consumer_tag)
+            while in_flight:
+                with self._pool.lock:
+                    self._conn.process_data_events(time_limit=0.05)
+            with self._pool.lock:
+                self._conn.remove_timeout(timer)
+                acks.flush(final=True)
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+            for signum, previous in previous_handlers.items():
+                signal.signal(signum, previous)
+
+        return handled
 
     def close(self) -> None:
         """
         Close the connection to the RabbitMQ server.
 
+        A shared connection stays open for other connectors: the channel goes
+        back to the pool, or is closed if it was used to consume. Shared
+        connections are closed at interpreter exit.
+
         This method is a no-op if the connection is already closed.
         """
-        if self._conn:
-            self._conn.close()
+        if self._pool is None:
+            return
+        if getattr(self, "_channel", None) is not None:
+            self._pool.release_channel(self._channel, reusable=not self._consumed)
+            self._channel = None
+        if not self._shared:
+            self._pool.close()
+            self._pool = None
 
         LOGGER.log(CustomLogLevel.CONNECTION, "RMQ disconnected.")
@@ -0,0 +1,93 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Lazily split an iterable into lists of at most ``size`` items
+    """
+    if size < 1:
+        raise ValueError("Batch size must be at least 1.")
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def iter_parallel(
+    sources: list[Callable[[], Iterable[T]]], buffer_size: int = 10_000
+) -> Iterator[T]:
+    """
+    Drain several iterables concurrently, one thread each, into a single iterator
+
+    Items are interleaved in arrival order through a bounded queue, so slow
+    consumers apply backpressure to the producers. The first producer error
+    is re-raised in the consumer, and closing the iterator stops the threads.
+    """
+    done = object()
+    buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain(source: Callable[[], Iterable[T]]) -> None:
+        try:
+            for item in source():
+                if not _put(item):
+                    return
+        except BaseException as e:  # re-raised by the consumer
+            _put(_SourceError(e))
+        finally:
+            _put(done)
+
+    threads = [
+        threading.Thread(target=_drain, args=(source,), daemon=True)
+        for source in sources
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        remaining = len(threads)
+        while remaining:
+            item = buffer.get()
+            if item is done:
+                remaining -= 1
+            elif isinstance(item, _SourceError):
+                raise item.error
+            else:
+                yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+class _SourceError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
@@ -0,0 +1,106 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from datetime import datetime
+
+ISO_FORMAT = "iso"
+
+# ISO and year-first formats, plus day-first ones for ambiguous dates, like
+# the fallback (``datetime.fromisoformat``, then dateutil with ``dayfirst``)
+CANDIDATE_FORMATS = (
+    ISO_FORMAT,
+    "%d/%m/%Y",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y %H:%M:%S",
+    "%d-%m-%Y",
+    "%d-%m-%Y %H:%M",
+    "%d-%m-%Y %H:%M:%S",
+    "%d.%m.%Y",
+    "%d.%m.%Y %H:%M",
+    "%d.%m.%Y %H:%M:%S",
+    "%Y/%m/%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%d %b %Y %H:%M:%S",
+    "%Y%m%d",
+)
+
+SAMPLE_SIZE = 50
+PANDAS_MIN_ROWS = 2048
+
+
+def _import_pandas():
+    # Imported on first large column, pandas is slow to import and optional
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return pd
+
+
+def _parse_one(value: str, fmt: str) -> datetime | None:
+    try:
+        if fmt == ISO_FORMAT:
+            return datetime.fromisoformat(value)
+        return datetime.strptime(value, fmt)
+    except ValueError:
+        return None
+
+
+def detect_format(values: list[str], sample_size: int = SAMPLE_SIZE) -> str | None:
+    """
+    Pick the candidate format matching most of a sample of ``values``
+    """
+    sample = [v.strip() for v in values[:sample_size]]
+    best, best_hits = None, 0
+    for fmt in CANDIDATE_FORMATS:
+        hits = sum(_parse_one(v, fmt) is not None for v in sample)
+        if hits > best_hits:
+            best, best_hits = fmt, hits
+            if hits == len(sample):
+                break
+    return best
+
+
+def parse_dates(
+    values: list[str], fmt: str | None = None
+) -> tuple[list[datetime | None], str | None]:
+    """
+    Parse a column of date strings with one fixed format.
+
+    The format is detected from a sample when not given. Values that don't
+    match it come back as ``None`` so the caller can fall back to a lenient
+    parser for those outliers only.
+
+    :return: Parsed values in input order, and the format that was used.
+    """
+    if fmt is None:
+        fmt = detect_format(values)
+    if fmt is None:
+        return [None] * len(values), None
+
+    stripped = [v.strip() for v in values]
+    pd = (
+        _import_pandas()
+        if fmt != ISO_FORMAT and len(values) >= PANDAS_MIN_ROWS
+        else None
+    )
+    if pd is not None:
+        result = pd.to_datetime(pd.Series(stripped), format=fmt, errors="coerce")
+        missing = result.isna().to_numpy()
+        parsed = list(result.dt.to_pydatetime())
+        return [None if m else v for v, m in zip(parsed, missing, strict=True)], fmt
+    return [_parse_one(v, fmt) for v in stripped], fmt
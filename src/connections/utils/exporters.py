@@ -0,0 +1,145 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from src.connections.utils.batching import iter_batches
+
+try:
+    import pyarrow as pa
+    from pyarrow import parquet as pq
+except ImportError:  # pyarrow is optional, only needed for Parquet output
+    pa = pq = None
+
+EXPORT_FORMATS = ("ndjson", "parquet")
+
+
+def write_ndjson(
+    path: str | Path, docs: Iterable[dict[str, Any]], default: Callable = str
+) -> int:
+    """
+    Write documents as newline-delimited JSON, returns the number written
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for doc in docs:
+            f.write(json.dumps(doc, default=default, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _conform(table: "pa.Table", schema: "pa.Schema") -> "pa.Table":
+    """Cast ``table`` to ``schema``, filling columns it lacks with nulls."""
+    columns = [
+        table.column(f.name).cast(f.type)
+        if f.name in table.column_names
+        else pa.nulls(len(table), f.type)
+        for f in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _batch_table(batch: list[dict[str, Any]]) -> "pa.Table":
+    """Build a table over the union of the batch's keys, in first-seen order."""
+    names = list(dict.fromkeys(k for doc in batch for k in doc))
+    arrays = {}
+    for name in names:
+        try:
+            arrays[name] = pa.array([doc.get(name) for doc in batch])
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(
+                f"Incompatible document fields for Parquet: field {name}: {e}"
+            ) from e
+    return pa.table(arrays)
+
+
+def _unify(schema: "pa.Schema", other: "pa.Schema") -> "pa.Schema":
+    try:
+        return pa.unify_schemas([schema, other], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise ValueError(f"Incompatible document fields for Parquet: {e}") from e
+
+
+def _rewrite(src: Path, dst: Path, schema: "pa.Schema") -> "pq.ParquetWriter":
+    """Copy the row groups written so far into a new file with ``schema``."""
+    writer = pq.ParquetWriter(str(dst), schema)
+    for batch in pq.ParquetFile(str(src)).iter_batches():
+        writer.write_table(_conform(pa.Table.from_batches([batch]), schema))
+    src.unlink()
+    return writer
+
+
+def write_parquet(
+    path: str | Path, docs: Iterable[dict[str, Any]], batch_rows: int = 10_000
+) -> int:
+    """
+    Write documents to a Parquet file, one row group per ``batch_rows``
+
+    The schema grows as batches bring new fields or fill columns that were
+    all-null; on such drift the rows written so far are rewritten to the
+    unified schema. Fields whose types can't be promoted raise ``ValueError``.
+    Rows go to a ``.partial`` file that only replaces ``path`` on success.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to export Parquet files.")
+    path = Path(path)
+    partial = [
+        path.with_name(f"{path.name}.partial"),
+        path.with_name(f"{path.name}.partial~"),
+    ]
+    count = 0
+    writer = schema = None
+    try:
+        for batch in iter_batches(docs, batch_rows):
+            table = _batch_table(batch)
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(str(partial[0]), schema)
+            else:
+                unified = _unify(schema, table.schema)
+                if not unified.equals(schema):
+                    writer.close()
+                    writer = _rewrite(partial[0], partial[1], unified)
+                    schema = unified
+                    partial.reverse()
+                table = _conform(table, schema)
+            writer.write_table(table)
+            count += len(batch)
+        if writer is not None:
+            writer.close()
+            writer = None
+            partial[0].replace(path)
+    finally:
+        if writer is not None:
+            writer.close()
+        for leftover in partial:
+            leftover.unlink(missing_ok=True)
+    return count
+
+
+def write_documents(
+    path: str | Path, docs: Iterable[dict[str, Any]], fmt: str = "ndjson"
+) -> int:
+    if fmt == "ndjson":
+        return write_ndjson(path, docs)
+    if fmt == "parquet":
+        return write_parquet(path, docs)
+    raise ValueError(
+        f"Unknown export format '{fmt}', expected one of {EXPORT_FORMATS}."
+    )
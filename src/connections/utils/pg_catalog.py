@@ -0,0 +1,111 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+DATETIME_TYPES = frozenset({"timestamp", "timestamptz", "date"})
+
+
+@dataclass(frozen=True)
+class ColumnMetadata:
+    name: str
+    data_type: str
+    type_name: str
+    nullable: bool
+    has_default: bool
+    default: str | None = None
+    pk_position: int | None = None
+
+
+@dataclass(frozen=True)
+class TableMetadata:
+    schema: str
+    table: str
+    columns: tuple[ColumnMetadata, ...]
+
+    @classmethod
+    def from_rows(
+        cls, schema: str, table: str, rows: list[tuple[Any, ...]]
+    ) -> "TableMetadata":
+        """Build from the rows of ``pg_queries.format_query_table_metadata``."""
+        return cls(schema, table, tuple(ColumnMetadata(*r) for r in rows))
+
+    @property
+    def column_types(self) -> dict[str, str]:
+        return {c.name: c.data_type for c in self.columns}
+
+    @property
+    def required_columns(self) -> list[str]:
+        return [c.name for c in self.columns if not c.nullable and not c.has_default]
+
+    @property
+    def primary_key_columns(self) -> list[str]:
+        keys = [c for c in self.columns if c.pk_position is not None]
+        return [c.name for c in sorted(keys, key=lambda c: c.pk_position)]
+
+    @property
+    def datetime_columns(self) -> set[str]:
+        return {c.name for c in self.columns if c.type_name in DATETIME_TYPES}
+
+
+class TableMetadataCache:
+    """
+    Thread-safe LRU cache of table metadata, entries expire after ``ttl`` seconds
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float, TableMetadata]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, schema: str, table: str) -> TableMetadata | None:
+        key = (schema, table)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, metadata = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return metadata
+
+    def put(self, metadata: TableMetadata) -> None:
+        key = (metadata.schema, metadata.table)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, metadata)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, schema: str | None = None, table: str | None = None) -> None:
+        """Drop matching entries, everything when no filter is given."""
+        with self._lock:
+            for key in list(self._entries):
+                if (schema is None or key[0] == schema) and (
+                    table is None or key[1] == table
+                ):
+                    del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -188,3 +188,109 @@ def format_query_update(
         set_clause=set_clause,
         where_clause=where_clause,
     )
+
+
+def format_query_copy_from(
+    schema: str, table: str, columns: list[str], binary: bool = False
+) -> sql.Composed:
+    """
+    Query for bulk load rows with COPY FROM STDIN
+    """
+    return sql.SQL("COPY {schema}.{table} ({fields}) FROM STDIN {options}").format(
+        schema=sql.Identifier(schema),
+        table=sql.Identifier(table),
+        fields=sql.SQL(", ").join(sql.Identifier(c) for c in columns),
+        options=sql.SQL("(FORMAT BINARY)") if binary else sql.SQL(""),
+    )
+
+
+def format_query_create_staging(
+    schema: str, table: str, staging: str, columns: list[str]
+) -> sql.Composed:
+    """
+    Query for create a temporary staging table shaped like the target columns
+    """
+    return sql.SQL(
+        "CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+        "SELECT {fields} FROM {schema}.{table} WITH NO DATA"
+    ).format(
+        staging=sql.Identifier(staging),
+        schema=sql.Identifier(schema),
+        table=sql.Identifier(table),
+        fields=sql.SQL(", ").join(sql.Identifier(c) for c in columns),
+    )
+
+
+def format_query_merge_staging(
+    schema: str,
+    table: str,
+    staging: str,
+    columns: list[str],
+    constraint_fields: list[str],
+    action: str = "update",
+) -> sql.Composed:
+    """
+    Query for upsert every staged row into the target in one statement
+    """
+    col_idents = [sql.Identifier(c) for c in columns]
+    update_cols = [c for c in columns if c not in constraint_fields]
+    if action == "update" and update_cols:
+        assignment = sql.SQL(", ").join(
+            sql.Composed(
+                [
+                    sql.Identifier(c),
+                    sql.SQL(" = "),
+                    sql.SQL("EXCLUDED.") + sql.Identifier(c),
+                ]
+            )
+            for c in update_cols
+        )
+        conflict_clause = sql.SQL("DO UPDATE SET ") + assignment
+    else:
+        conflict_clause = sql.SQL("DO NOTHING")
+    return sql.SQL(
+        "INSERT INTO {schema}.{table} ({fields}) "
+        "SELECT {fields} FROM pg_temp.{staging} "
+        "ON CONFLICT ({conflict}) {action}"
+    ).format(
+        schema=sql.Identifier(schema),
+        table=sql.Identifier(table),
+        staging=sql.Identifier(staging),
+        fields=sql.SQL(", ").join(col_idents),
+        conflict=sql.SQL(", ").join(sql.Identifier(f) for f in constraint_fields),
+        action=conflict_clause,
+    )
+
+
+def format_query_table_metadata(schema: str, table: str) -> sql.SQL:
+    """
+    Query for get columns, types, nullability, defaults and primary key at once
+    """
+    return sql.SQL("""
+        SELECT a.attname,
+            format_type(a.atttypid, NULL),
+            t.typname,
+            NOT a.attnotnull,
+            a.atthasdef OR a.attidentity <> '' OR a.attgenerated <> '',
+            pg_get_expr(d.adbin, d.adrelid),
+            pk.position
+        FROM pg_catalog.pg_attribute a
+        JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_catalog.pg_type t ON t.oid = a.atttypid
+        LEFT JOIN pg_catalog.pg_attrdef d
+            ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+        LEFT JOIN LATERAL (
+            SELECT k.position
+            FROM pg_catalog.pg_index i,
+                unnest(i.indkey) WITH ORDINALITY AS k(attnum, position)
+            WHERE i.indrelid = c.oid
+                AND i.indisprimary
+                AND k.attnum = a.attnum
+        ) pk ON true
+        WHERE n.nspname = {schema}
+            AND c.relname = {table}
+            AND a.attnum > 0
+            AND NOT a.attisdropped
+        ORDER BY a.attnum
+    """).format(schema=schema, table=table)
@@ -0,0 +1,102 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections.abc import Callable
+from typing import Any
+
+from bson import json_util
+
+# A sink takes a batch of events and returns only once the batch is durably
+# accepted, raising otherwise. The adapters below wrap the project connectors
+# without importing them.
+Sink = Callable[[list[dict[str, Any]]], None]
+
+
+def dumps_event(event: dict[str, Any]) -> str:
+    """Serialize a BSON document as relaxed Extended JSON."""
+    return json_util.dumps(event, json_options=json_util.RELAXED_JSON_OPTIONS)
+
+
+def _document_key(event: dict[str, Any]) -> str | None:
+    key = event.get("documentKey", {}).get("_id")
+    return None if key is None else str(key)
+
+
+def kafka_sink(connector, topic: str, flush_timeout: float = 30.0) -> Sink:
+    """
+    Produce each event to ``topic`` keyed by its document ``_id``, so changes
+    of one document stay ordered within a partition.
+
+    :param connector: ``KafkaConnector`` with an initialized producer.
+    """
+
+    def _sink(events: list[dict[str, Any]]) -> None:
+        failed = connector.producer_stats.failed
+        connector.produce_batch(
+            topic, ((_document_key(e), dumps_event(e)) for e in events)
+        )
+        if connector.flush(flush_timeout):
+            raise TimeoutError(f"Kafka flush timed out for topic {topic}.")
+        if connector.producer_stats.failed > failed:
+            raise RuntimeError(
+                f"Kafka rejected events: {connector.producer_stats.last_error}"
+            )
+
+    return _sink
+
+
+def rmq_sink(connector, routing_key: str | None = None) -> Sink:
+    """
+    Publish events with publisher confirms.
+
+    :param connector: ``RMQConnector`` whose exchange already exists.
+    """
+
+    def _sink(events: list[dict[str, Any]]) -> None:
+        result = connector.publish_many(
+            map(dumps_event, events), routing_key=routing_key
+        )
+        if result.failed:
+            raise RuntimeError(f"RMQ failed to publish {len(result.failed)} events.")
+
+    return _sink
+
+
+def postgres_sink(
+    connector,
+    schema: str,
+    table: str,
+    to_row: Callable[[dict[str, Any]], dict[str, Any] | None],
+    conflict_columns: list[str] | None = None,
+) -> Sink:
+    """
+    Upsert the rows mapped from events; events mapped to ``None`` are skipped.
+
+    :param connector: ``PostgreConnector``.
+    :param to_row: Maps a change event to a row of ``schema.table``.
+    """
+
+    def _sink(events: list[dict[str, Any]]) -> None:
+        rows = [row for row in map(to_row, events) if row is not None]
+        if rows:
+            connector.upsert_rows(
+                schema,
+                table,
+                rows,
+                conflict_columns=conflict_columns,
+                batch_size=len(rows),
+            )
+
+    return _sink
@@ -15,14 +15,18 @@
 
 import typer
 
-from src.commands import base
-from src.configs import CustomLogLevel, logging, project_meta
+from src.commands.lazy import LazyTyperGroup
+from src.configs import get_project_meta, logging, setup_logging
 
-app = typer.Typer(pretty_exceptions_show_locals=False)
 
-LOGGER = logging.getLogger(project_meta.name)
+class CLIGroup(LazyTyperGroup):
+    lazy_subcommands = {
+        "base": ("src.commands.base", "Example commands."),
+        "pipeline": ("src.commands.pipeline", "Data pipelines between connectors."),
+    }
 
-app.add_typer(base.app, name="base")
+
+app = typer.Typer(cls=CLIGroup, pretty_exceptions_show_locals=False)
 
 
 @app.callback()
@@ -31,9 +35,13 @@ def main(
         False, "--verbose", "-v", help="Enable verbose logging"
     ),
 ):
+    from typica.utils.log import CustomLogLevel
+
+    setup_logging()
+    logger = logging.getLogger(get_project_meta().name)
     if verbose:
         logging.getLogger().setLevel(CustomLogLevel.INFO)
-        LOGGER.debug("Verbose mode enabled")
+        logger.debug("Verbose mode enabled")
     else:
         logging.getLogger().setLevel(CustomLogLevel.NOTSET)
 
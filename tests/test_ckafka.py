@@ -0,0 +1,125 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.connections.ckafka import KafkaConnector, KafkaRecord, _PartitionDispatcher
+
+
+def _records(partition: int, *offsets: int) -> list[KafkaRecord]:
+    return [KafkaRecord("t", partition, o, None, b"{}") for o in offsets]
+
+
+def test_dispatcher_keeps_partition_order():
+    seen: dict[int, list[int]] = {0: [], 1: []}
+    running: set[int] = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def handler(records: list[KafkaRecord]) -> None:
+        partition = records[0].partition
+        with lock:
+            if partition in running:
+                overlaps.append(partition)
+            running.add(partition)
+        time.sleep(0.01)
+        seen[partition].extend(r.offset for r in records)
+        with lock:
+            running.discard(partition)
+
+    with ThreadPoolExecutor(4) as executor:
+        dispatcher = _PartitionDispatcher(executor, handler)
+        for start in range(0, 12, 3):
+            dispatcher.dispatch(
+                _records(0, start, start + 1, start + 2) + _records(1, start)
+            )
+        offsets = {(tp.partition, tp.offset) for tp in dispatcher.drain()}
+
+    assert seen == {0: list(range(12)), 1: [0, 3, 6, 9]}
+    assert overlaps == []
+    assert offsets == {(0, 12), (1, 10)}
+    assert dispatcher.handled == 16 and dispatcher.pending == 0
+
+
+def test_dispatcher_failure_keeps_other_offsets():
+    def handler(records: list[KafkaRecord]) -> None:
+        if records[0].partition == 0:
+            raise ValueError("boom")
+
+    executor = ThreadPoolExecutor(2)
+    dispatcher = _PartitionDispatcher(executor, handler)
+    dispatcher.dispatch(_records(0, 0, 1) + _records(1, 2))
+    dispatcher.dispatch(_records(0, 2))
+    executor.shutdown(wait=True)
+
+    offsets = dispatcher.collect()
+    assert [(tp.partition, tp.offset) for tp in offsets] == [(1, 3)]
+    assert isinstance(dispatcher.error, ValueError)
+    # The partition's queued group is dropped, nothing past the failure runs.
+    assert dispatcher.pending == 0
+    assert dispatcher.drain() == []
+
+
+class _Message:
+    def __init__(self, record: KafkaRecord):
+        self._record = record
+
+    def error(self):
+        return None
+
+    def timestamp(self):
+        return 0, None
+
+    def __getattr__(self, name):
+        return lambda: getattr(self._record, name)
+
+
+class _Consumer:
+    def __init__(self, batches: list[list[KafkaRecord]]):
+        self._batches = [[_Message(r) for r in batch] for batch in batches]
+        self.commits = []
+
+    def subscribe(self, topics, on_revoke=None):
+        pass
+
+    def consume(self, num_messages, timeout):
+        time.sleep(0.01)
+        return self._batches.pop(0) if self._batches else []
+
+    def commit(self, offsets, asynchronous):
+        self.commits.extend((tp.partition, tp.offset) for tp in offsets)
+
+    def assignment(self):
+        return []
+
+
+def test_consume_batches_commits_successes_before_raising():
+    def handler(records: list[KafkaRecord]) -> None:
+        if records[0].partition == 0:
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+    connector = KafkaConnector.__new__(KafkaConnector)
+    connector._meta = type("Meta", (), {"topic_list": ["t"]})()
+    connector.consumer = _Consumer([_records(0, 0) + _records(1, 0, 1, 2)])
+
+    with pytest.raises(ValueError, match="boom"):
+        connector.consume_batches(handler, max_workers=2)
+    assert (1, 3) in connector.consumer.commits
+    assert all(partition == 1 for partition, _ in connector.consumer.commits)
@@ -0,0 +1,44 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from datetime import datetime
+
+from src.connections.postgre import BasePostgreConnector
+from src.connections.utils.date_parsing import detect_format, parse_dates
+
+
+def test_detect_day_first_format():
+    assert detect_format(["02/01/2020", "13/01/2020", "junk"]) == "%d/%m/%Y"
+    assert detect_format(["2020-01-02T10:11:12"]) == "iso"
+    assert detect_format(["junk"]) is None
+
+
+def test_parse_dates_leaves_outliers_for_fallback():
+    parsed, fmt = parse_dates([" 02-01-2020 10:11", "2 / 1 / 2020"])
+    assert fmt == "%d-%m-%Y %H:%M"
+    assert parsed == [datetime(2020, 1, 2, 10, 11), None]
+
+
+def test_mixed_column_keeps_iso_outliers_iso():
+    connector = BasePostgreConnector.__new__(BasePostgreConnector)
+    batch = [{"d": "13/01/2024"}, {"d": "02/01/2024"}, {"d": "2024-01-02"}]
+    formats: dict[str, str | None] = {}
+    connector._normalize_batch_dates(batch, {"d"}, formats)
+    assert formats == {"d": "%d/%m/%Y"}
+    assert [row["d"] for row in batch] == [
+        datetime(2024, 1, 13),
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 2),
+    ]
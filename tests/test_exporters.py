@@ -0,0 +1,55 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from src.connections.utils.exporters import write_parquet
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_write_parquet_schema_drift(tmp_path):
+    path = tmp_path / "docs.parquet"
+    docs = [
+        {"id": 1, "tag": None},
+        {"id": 2, "tag": None},
+        {"id": 3, "tag": "x", "extra": True},
+        {"id": 4},
+    ]
+    assert write_parquet(path, docs, batch_rows=2) == 4
+
+    table = pq.read_table(path)
+    assert table.column_names == ["id", "tag", "extra"]
+    assert table.to_pylist()[2] == {"id": 3, "tag": "x", "extra": True}
+    assert table.to_pylist()[3] == {"id": 4, "tag": None, "extra": None}
+    assert [p.name for p in tmp_path.iterdir()] == ["docs.parquet"]
+
+
+def test_write_parquet_incompatible_types(tmp_path):
+    path = tmp_path / "docs.parquet"
+    with pytest.raises(ValueError, match="id"):
+        write_parquet(path, [{"id": 1}, {"id": "a"}], batch_rows=1)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_parquet_drift_within_batch(tmp_path):
+    path = tmp_path / "docs.parquet"
+    docs = [{"_id": "1", "a": 1}, {"_id": "2", "a": 2, "b": "x"}]
+    assert write_parquet(path, docs) == 2
+
+    assert pq.read_table(path).to_pylist() == [
+        {"_id": "1", "a": 1, "b": None},
+        {"_id": "2", "a": 2, "b": "x"},
+    ]
@@ -0,0 +1,71 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = (
+    "confluent_kafka",
+    "elasticsearch7",
+    "elasticsearch8",
+    "pandas",
+    "pika",
+    "psycopg",
+    "pyarrow",
+    "pymongo",
+    "sqlalchemy",
+)
+HELP_BUDGET_SECONDS = 1.0
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from src.main import app
+try:
+    app(sys.argv[1:], prog_name="cli-exec")
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}), file=sys.stderr)
+"""
+
+
+def _probe(*args: str) -> dict:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", PROBE, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def test_help_within_budget():
+    probe = _probe("--help")
+    assert not [m for m in HEAVY_MODULES if m in probe["modules"]]
+    assert "src.commands.pipeline" not in probe["modules"]
+    assert probe["elapsed"] < HELP_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize("group", ["base", "pipeline"])
+def test_group_help_skips_drivers(group: str):
+    probe = _probe(group, "--help")
+    assert not [m for m in HEAVY_MODULES if m in probe["modules"]]
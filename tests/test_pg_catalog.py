@@ -0,0 +1,53 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from src.connections.utils.pg_catalog import TableMetadata, TableMetadataCache
+
+ROWS = [
+    ("id", "bigint", "int8", False, True, "nextval('t_id_seq'::regclass)", 1),
+    ("code", "text", "text", False, False, None, 2),
+    ("name", "text", "text", False, False, None, None),
+    ("created_at", "timestamp with time zone", "timestamptz", True, False, None, None),
+]
+
+
+def test_table_metadata_from_rows():
+    metadata = TableMetadata.from_rows("public", "t", ROWS)
+    assert metadata.required_columns == ["code", "name"]
+    assert metadata.primary_key_columns == ["id", "code"]
+    assert metadata.datetime_columns == {"created_at"}
+    assert metadata.column_types["created_at"] == "timestamp with time zone"
+
+
+def test_cache_lru_and_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        "src.connections.utils.pg_catalog.time.monotonic", lambda: now[0]
+    )
+    cache = TableMetadataCache(maxsize=2, ttl=10)
+    for table in ("a", "b"):
+        cache.put(TableMetadata.from_rows("public", table, ROWS))
+    assert cache.get("public", "a") is not None
+    cache.put(TableMetadata.from_rows("public", "c", ROWS))
+    assert cache.get("public", "b") is None
+    assert cache.get("public", "a") is not None
+
+    now[0] = 11.0
+    assert cache.get("public", "a") is None
+
+    cache.put(TableMetadata.from_rows("public", "a", ROWS))
+    cache.invalidate(table="a")
+    assert cache.get("public", "a") is None
@@ -0,0 +1,98 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+from typer.testing import CliRunner
+
+from src.commands.pipeline import _to_rows
+from src.connections.ckafka import KafkaRecord
+from src.connections.postgre import ValidationError
+from src.connections.utils.pg_catalog import TableMetadata
+from src.main import app
+
+runner = CliRunner()
+
+METADATA = TableMetadata.from_rows(
+    "public",
+    "t",
+    [
+        ("id", "bigint", "int8", False, False, None, 1),
+        ("name", "text", "text", True, False, None, None),
+    ],
+)
+
+
+def _record(offset: int, value: bytes | None) -> KafkaRecord:
+    return KafkaRecord("events", 0, offset, None, value)
+
+
+def test_to_rows_projects_onto_table_columns():
+    records = [
+        _record(0, b'{"id": 1, "extra": true}'),
+        _record(1, b'{"id": 2, "name": "b"}'),
+    ]
+    [(columns, rows)] = _to_rows(records, METADATA)
+    assert columns == ["id", "name"]
+    assert rows == [{"id": 1, "name": None}, {"id": 2, "name": "b"}]
+
+
+def test_to_rows_never_pads_defaulted_columns():
+    metadata = TableMetadata.from_rows(
+        "public",
+        "t",
+        [
+            ("id", "bigint", "int8", False, False, None, 1),
+            (
+                "created_at",
+                "timestamp with time zone",
+                "timestamptz",
+                False,
+                True,
+                "now()",
+                None,
+            ),
+        ],
+    )
+    records = [
+        _record(0, b'{"id": 1}'),
+        _record(1, b'{"id": 2, "created_at": "2024-01-01T00:00:00Z"}'),
+        _record(2, b'{"id": 3}'),
+    ]
+    assert _to_rows(records, metadata) == [
+        (["id"], [{"id": 1}, {"id": 3}]),
+        (["id", "created_at"], [{"id": 2, "created_at": "2024-01-01T00:00:00Z"}]),
+    ]
+    assert [
+        [row["id"] for row in rows]
+        for _, rows in _to_rows(records, metadata, keep_order=True)
+    ] == [[1], [2], [3]]
+
+
+def test_to_rows_invalid_records():
+    records = [
+        _record(0, b'{"name": "a"}'),
+        _record(1, b"not json"),
+        _record(2, b'{"id": 3}'),
+    ]
+    with pytest.raises(ValidationError, match="events\\[0\\]@0"):
+        _to_rows(records, METADATA)
+    [(_, rows)] = _to_rows(records, METADATA, skip_invalid=True)
+    assert rows == [{"id": 3}]
+
+
+def test_kafka_to_pg_help():
+    result = runner.invoke(app, ["pipeline", "kafka-to-pg", "--help"])
+    assert result.exit_code == 0
+    assert "--batch-size" in result.output
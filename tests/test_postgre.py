@@ -0,0 +1,41 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from datetime import date, datetime
+from uuid import uuid4
+
+from src.connections.postgre import BasePostgreConnector
+
+COLUMNS = ["flag", "doc", "id", "day"]
+TYPES = ["boolean", "jsonb", "uuid", "date"]
+
+
+def _binary(rows):
+    connector = BasePostgreConnector.__new__(BasePostgreConnector)
+    return connector._binary_batch_types(rows, COLUMNS, TYPES)
+
+
+def test_binary_copy_needs_matching_values():
+    good = {"flag": False, "doc": {"a": 1}, "id": uuid4(), "day": date(2024, 1, 2)}
+    assert _binary([good, dict.fromkeys(COLUMNS)]) == TYPES
+
+    for column, value in [
+        ("flag", "false"),
+        ("flag", 0),
+        ("doc", '{"a": 1}'),
+        ("id", str(uuid4())),
+        ("day", datetime(2024, 1, 2)),
+    ]:
+        assert _binary([good, {**good, column: value}]) is None, column
@@ -0,0 +1,107 @@
+# Copyright (C) 2026 Oktapiancaw
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from types import SimpleNamespace
+
+from pika import BasicProperties
+
+from src.connections.rmq import _AckBatcher, _ConfirmPublisher
+
+
+class _Channel:
+    def __init__(self):
+        self.calls = []
+        self.is_open = True
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.calls.append(("ack", delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag, requeue):
+        self.calls.append(("nack", delivery_tag, requeue))
+
+    def basic_publish(self, exchange, routing_key, body, properties, mandatory):
+        self.calls.append(("publish", int(properties.message_id)))
+
+
+def test_ack_batcher_acks_contiguous_ranges():
+    channel = _Channel()
+    acks = _AckBatcher(channel, batch_size=3)
+    for tag in (2, 3, 1):
+        acks.settle(tag, True, requeue=False)
+    assert channel.calls == [("ack", 3, True)]
+
+    acks.settle(5, True, requeue=False)
+    acks.settle(4, False, requeue=True)
+    acks.settle(7, True, requeue=False)
+    acks.flush()
+    # The nack is sent at once; the multiple ack stops at the last success
+    # before the gap at 6.
+    assert channel.calls[1:] == [("nack", 4, True), ("ack", 5, True)]
+
+    acks.flush(final=True)
+    assert channel.calls[3:] == [("ack", 7, False)]
+
+
+def _confirm(name: str, tag: int, multiple: bool) -> SimpleNamespace:
+    return SimpleNamespace(
+        method=SimpleNamespace(NAME=name, delivery_tag=tag, multiple=multiple)
+    )
+
+
+def test_confirm_publisher_multiple_boundaries():
+    publisher = _ConfirmPublisher(parameters=None)
+    publisher._reset(
+        iter([(i, b"m") for i in range(5)]),
+        "ex",
+        "rk",
+        BasicProperties(),
+        max_outstanding=10,
+        max_retries=1,
+        confirm_timeout=30.0,
+    )
+    publisher._channel = _Channel()
+    publisher._publish()
+    assert list(publisher._outstanding) == [1, 2, 3, 4, 5]
+
+    publisher._on_confirm(_confirm("Basic.Ack", 3, multiple=True))
+    assert list(publisher._outstanding) == [4, 5]
+    assert publisher.result.confirmed == 3
+
+    publisher._on_return(None, None, BasicProperties(message_id="3"), b"m")
+    publisher._on_confirm(_confirm("Basic.Nack", 5, multiple=True))
+    # Message 3 (tag 4) was returned and fails, message 4 (tag 5) is
+    # republished under the next tag.
+    assert publisher.result.failed == [(3, "unroutable")]
+    assert list(publisher._outstanding.items()) == [(6, (4, b"m"))]
+
+    publisher._on_confirm(_confirm("Basic.Ack", 6, multiple=False))
+    assert publisher.result.confirmed == 4
+    assert publisher.result.retried == 1
+    assert publisher._finished.is_set() and publisher._error is None
+
+
+def test_confirm_publisher_fails_call_on_bad_message():
+    def messages():
+        yield 0, b"m"
+        raise ValueError("Failed to serialize message to JSON")
+
+    publisher = _ConfirmPublisher(parameters=None)
+    publisher._reset(messages(), "ex", "rk", BasicProperties(), 10, 1, 30.0)
+    publisher._channel = _Channel()
+    publisher._publish()
+
+    assert publisher._finished.is_set()
+    assert isinstance(publisher._error, ValueError)
+    assert publisher._channel.calls == [("publish", 0)]